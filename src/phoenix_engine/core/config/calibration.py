@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import Enum
-from pydantic import BaseModel, Field
-from typing import Optional, Tuple
+from functools import cached_property
+from operator import attrgetter
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, Optional, Tuple
 
 from phoenix_engine.domain.enums import (
     NodeMode,
@@ -15,34 +18,69 @@ from phoenix_engine.domain.enums import (
 )
 
 
+# Session-scoped policy is immutable: frozen models are hashable (usable as
+# cache keys) and keep the cached signature valid; typos in field names fail.
+_POLICY_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+
 class AtmosphericConfig(BaseModel):
+    model_config = _POLICY_MODEL_CONFIG
+
     pressure_mbar: float = 1013.25
     temperature_c: float = 15.0
 
+    def to_internal(self) -> AtmosphericSnapshot:
+        return AtmosphericSnapshot(pressure_mbar=self.pressure_mbar, temperature_c=self.temperature_c)
+
 
 class RiseSetStyle(str, Enum):
     PYJHORA_DRiK = "PYJHORA_DRiK"
     DISC_POLICY = "DISC_POLICY"
 
 
+class CacheEviction(str, Enum):
+    LRU = "LRU"  # bounded by cache_maxsize, recency order
+    GENERATIONAL = "GENERATIONAL"  # periodic sweep of untouched entries (forward scans)
+
+
 class RiseSetPolicy(BaseModel):
+    model_config = _POLICY_MODEL_CONFIG
+
     style: RiseSetStyle = RiseSetStyle.PYJHORA_DRiK
     disc: SunriseDisc = SunriseDisc.DISC_EDGE
     use_refraction: bool = True
     atmosphere: AtmosphericConfig = Field(default_factory=AtmosphericConfig)
 
+    def to_internal(self) -> RiseSetSnapshot:
+        return RiseSetSnapshot(
+            style=self.style,
+            disc=self.disc,
+            use_refraction=self.use_refraction,
+            atmosphere=self.atmosphere.to_internal(),
+        )
+
 
 class AyanamsaConfig(BaseModel):
+    model_config = _POLICY_MODEL_CONFIG
+
     mode: AyanamsaMode = AyanamsaMode.TRUE_CITRA
     # Only used if mode == USER_DEFINED
     t0: float = 0.0
     ayan_t0: float = 0.0
 
+    def to_internal(self) -> AyanamsaSnapshot:
+        return AyanamsaSnapshot(mode=self.mode, t0=self.t0, ayan_t0=self.ayan_t0)
+
 
 class TopoConfig(BaseModel):
+    model_config = _POLICY_MODEL_CONFIG
+
     enabled: bool = False
     altitude_m: float = 0.0
 
+    def to_internal(self) -> TopoSnapshot:
+        return TopoSnapshot(enabled=self.enabled, altitude_m=self.altitude_m)
+
 
 class CalibrationConfig(BaseModel):
     """
@@ -50,6 +88,8 @@ class CalibrationConfig(BaseModel):
     Apply at *session scope* (one chart / one batch).
     """
 
+    model_config = _POLICY_MODEL_CONFIG
+
     zodiac_type: ZodiacType = ZodiacType.SIDEREAL
     perspective: PerspectiveType = PerspectiveType.TOPOCENTRIC
 
@@ -70,24 +110,128 @@ class CalibrationConfig(BaseModel):
     # Cleanup policy (perf-first; lock provides safety)
     reset_topo_on_exit: bool = True
 
+    # Provider L1 cache bound (entries). Not part of the signature: it never
+    # changes results, only how many of them are kept.
+    cache_maxsize: int = Field(default=8192, ge=1)
+    # GENERATIONAL sweeps every cache_maxsize // 2 inserts and keeps entries
+    # touched in the last two generations.
+    cache_eviction: CacheEviction = CacheEviction.LRU
+
+    # Opt-in persistent rise/set cache (SQLite). Also outside the signature:
+    # disk keys carry the full per-call policy.
+    use_disk_cache: bool = False
+    disk_cache_dir: Optional[str] = None  # None -> ~/.cache/phoenix_engine/rise_set
+    disk_cache_max_entries: int = Field(default=1_000_000, ge=1)
+
     def signature(self) -> Tuple:
-        """Hashable signature for session-local caching keys."""
-        a = self.ayanamsa
-        s = self.sunrise
-        return (
-            self.zodiac_type.value,
-            self.perspective.value,
-            a.mode.value, float(a.t0), float(a.ayan_t0),
-            self.nodes.value,
-            self.houses.value,
-            self.house_system.value,
-            s.style.value, s.disc.value, bool(s.use_refraction),
-            float(s.atmosphere.pressure_mbar),
-            float(s.atmosphere.temperature_c),
-            bool(self.topo.enabled),
-            float(self.topo.altitude_m),
-            bool(self.use_microseconds),
-            bool(self.use_speed),
-            bool(self.use_truepos),
-            bool(self.reset_topo_on_exit),
+        """Hashable signature for session-local caching keys (built once per instance)."""
+        return self._signature
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "CalibrationConfig":
+        copied = super().model_copy(update=update, deep=deep)
+        # cached_property lives in __dict__ and would be copied stale
+        copied.__dict__.pop("_signature", None)
+        return copied
+
+    def to_internal(self) -> CalibrationSnapshot:
+        """Validated input schema -> immutable snapshot for hot paths."""
+        return CalibrationSnapshot(
+            zodiac_type=self.zodiac_type,
+            perspective=self.perspective,
+            ayanamsa=self.ayanamsa.to_internal(),
+            nodes=self.nodes,
+            houses=self.houses,
+            house_system=self.house_system,
+            sunrise=self.sunrise.to_internal(),
+            topo=self.topo.to_internal(),
+            use_microseconds=self.use_microseconds,
+            use_speed=self.use_speed,
+            use_truepos=self.use_truepos,
+            reset_topo_on_exit=self.reset_topo_on_exit,
+            cache_maxsize=self.cache_maxsize,
+            cache_eviction=self.cache_eviction,
+            use_disk_cache=self.use_disk_cache,
+            disk_cache_dir=self.disk_cache_dir,
+            disk_cache_max_entries=self.disk_cache_max_entries,
         )
+
+    @cached_property
+    def _signature(self) -> Tuple:
+        # Pydantic already enforces the field types, so no casts are needed.
+        return _SIGNATURE_GETTER(self)
+
+
+# -----------------------------
+# Internal snapshots
+# -----------------------------
+# The Pydantic models above are the validated input schema. Hot paths
+# (providers, solvers) read these frozen, slotted mirrors instead: no
+# validator dispatch, slot attribute access, and natively hashable so a
+# snapshot can key caches directly.
+
+@dataclass(frozen=True, slots=True)
+class AtmosphericSnapshot:
+    pressure_mbar: float
+    temperature_c: float
+
+
+@dataclass(frozen=True, slots=True)
+class RiseSetSnapshot:
+    style: RiseSetStyle
+    disc: SunriseDisc
+    use_refraction: bool
+    atmosphere: AtmosphericSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class AyanamsaSnapshot:
+    mode: AyanamsaMode
+    t0: float
+    ayan_t0: float
+
+
+@dataclass(frozen=True, slots=True)
+class TopoSnapshot:
+    enabled: bool
+    altitude_m: float
+
+
+@dataclass(frozen=True, slots=True)
+class CalibrationSnapshot:
+    zodiac_type: ZodiacType
+    perspective: PerspectiveType
+    ayanamsa: AyanamsaSnapshot
+    nodes: NodeMode
+    houses: HouseCalculationMode
+    house_system: HouseSystem
+    sunrise: RiseSetSnapshot
+    topo: TopoSnapshot
+    use_microseconds: bool
+    use_speed: bool
+    use_truepos: bool
+    reset_topo_on_exit: bool
+    cache_maxsize: int
+    cache_eviction: CacheEviction
+    use_disk_cache: bool
+    disk_cache_dir: Optional[str]
+    disk_cache_max_entries: int
+
+
+# One C-level pass over the config graph; order defines the signature layout.
+_SIGNATURE_GETTER = attrgetter(
+    "zodiac_type.value",
+    "perspective.value",
+    "ayanamsa.mode.value", "ayanamsa.t0", "ayanamsa.ayan_t0",
+    "nodes.value",
+    "houses.value",
+    "house_system.value",
+    "sunrise.style.value", "sunrise.disc.value", "sunrise.use_refraction",
+    "sunrise.atmosphere.pressure_mbar",
+    "sunrise.atmosphere.temperature_c",
+    "topo.enabled",
+    "topo.altitude_m",
+    "use_microseconds",
+    "use_speed",
+    "use_truepos",
+    "reset_topo_on_exit",
+)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+"""Optional Numba support.
+
+``njit`` compiles with Numba when it is installed and degrades to a no-op
+decorator otherwise, so kernels stay importable and correct in pure-Python
+deployments. Callers that have a faster pure-Python path check ``HAS_NUMBA``.
+"""
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - depends on the deployment
+    _numba_njit = None
+
+HAS_NUMBA = _numba_njit is not None
+
+# fastmath flags that keep IEEE NaN/inf semantics (kernels use NaN as an error sentinel).
+SAFE_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """``numba.njit`` when available, identity decorator otherwise."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return fn
+
+    return decorate
+
+
+__all__ = ["HAS_NUMBA", "SAFE_FASTMATH", "njit"]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+"""Optional C-implemented LRU mapping.
+
+``make_lru`` returns an ``lru.LRU`` (the ``lru-dict`` package) when it is
+installed and an ``OrderedDict``-based equivalent otherwise. Both support
+``key in cache``, ``cache[key]``, ``cache[key] = value``, ``get`` and
+``clear``; reads refresh recency and inserts beyond ``maxsize`` evict the
+least recently used entry.
+
+``GenerationalDict`` is the cheaper alternative for scans that march
+forward in time: no per-access reordering, just a periodic sweep that
+drops entries nobody touched in the last couple of generations.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping as _MutableMappingABC
+from typing import Any, Dict, Iterator, MutableMapping, Tuple
+
+try:
+    from lru import LRU as _CLRU
+except ImportError:  # pragma: no cover - depends on the deployment
+    _CLRU = None
+
+HAS_LRU_DICT = _CLRU is not None
+
+
+class PyLRU(OrderedDict):
+    """Pure-Python fallback with the subset of the ``lru.LRU`` API we use."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1.")
+        self.maxsize = int(maxsize)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get_size(self) -> int:
+        return self.maxsize
+
+
+class GenerationalDict(_MutableMappingABC):
+    """Mapping tagged with a generation counter instead of recency order.
+
+    Every ``sweep_every`` inserts the generation advances and entries last
+    written or read more than ``keep_generations`` generations ago are
+    deleted in one pass. Callers can also ``advance()`` explicitly (e.g. per
+    date in a pipeline).
+    """
+
+    __slots__ = ("sweep_every", "keep_generations", "generation", "_inserts", "_data")
+
+    def __init__(self, sweep_every: int = 4096, keep_generations: int = 2) -> None:
+        if sweep_every < 1:
+            raise ValueError("sweep_every must be >= 1.")
+        if keep_generations < 0:
+            raise ValueError("keep_generations must be >= 0.")
+        self.sweep_every = int(sweep_every)
+        self.keep_generations = int(keep_generations)
+        self.generation = 0
+        self._inserts = 0
+        self._data: Dict[Any, Tuple[Any, int]] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        value, gen = self._data[key]
+        if gen != self.generation:
+            self._data[key] = (value, self.generation)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[1] != self.generation:
+            self._data[key] = (entry[0], self.generation)
+        return entry[0]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._data[key] = (value, self.generation)
+        self._inserts += 1
+        if self._inserts >= self.sweep_every:
+            self.advance()
+
+    def __delitem__(self, key: Any) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._inserts = 0
+
+    def advance(self) -> None:
+        """Start a new generation and drop entries older than the kept window."""
+        self.generation += 1
+        self._inserts = 0
+        cutoff = self.generation - self.keep_generations
+        data = self._data
+        for key in [k for k, (_, gen) in data.items() if gen < cutoff]:
+            del data[key]
+
+
+def make_lru(maxsize: int) -> MutableMapping[Any, Any]:
+    """Bounded LRU mapping; C-backed when ``lru-dict`` is available."""
+    if _CLRU is not None:
+        return _CLRU(int(maxsize))
+    return PyLRU(maxsize)
+
+
+__all__ = ["GenerationalDict", "HAS_LRU_DICT", "PyLRU", "make_lru"]
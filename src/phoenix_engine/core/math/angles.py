@@ -5,34 +5,63 @@ from __future__ import annotations
 All angles are in degrees unless stated otherwise.
 """
 
-from typing import Iterable, List
+import math
+from math import floor
+from typing import Iterable, Tuple
+
+import numpy as np
+
+# Below this length the NumPy setup cost outweighs the vectorized loop.
+_VECTORIZE_MIN_LEN = 8
 
 
 def normalize_angle(angle: float, *, start: float = 0.0, period: float = 360.0) -> float:
     """Normalize angle into [start, start + period)."""
-    a = float(angle)
     s = float(start)
     p = float(period)
-    return (a - s) % p + s
+    # floor form: same result as `%` for finite inputs, no sign branch
+    r = float(angle) - s
+    return r - p * floor(r / p) + s
 
 
-def unwrap_angles(angles: Iterable[float], *, period: float = 360.0) -> List[float]:
+def unwrap_angles(angles: Iterable[float], *, period: float = 360.0) -> Tuple[float, ...]:
     """Unwrap circular angles into a continuous sequence.
 
     Uses the shortest signed difference to avoid jumps at wrap boundaries.
-    Example: [340, 350, 10, 20] -> [340, 350, 370, 380]
+    Example: [340, 350, 10, 20] -> (340, 350, 370, 380)
+
+    Same semantics as ``np.unwrap`` generalized to an arbitrary ``period``;
+    sequences of at least ``_VECTORIZE_MIN_LEN`` samples run as NumPy ufuncs.
     """
-    seq = [float(x) for x in angles]
-    if not seq:
-        return []
+    if isinstance(angles, np.ndarray):
+        angles = angles.astype(np.float64, copy=False)
+    elif not isinstance(angles, (list, tuple)):
+        angles = list(angles)
+    if len(angles) == 0:
+        return ()
 
-    out = [seq[0]]
     half = period / 2.0
-    for a in seq[1:]:
-        prev = out[-1]
-        diff = (a - prev + half) % period - half
-        out.append(prev + diff)
-    return out
+    if len(angles) < _VECTORIZE_MIN_LEN:
+        if isinstance(angles, np.ndarray):
+            seq = angles.tolist()
+        elif all(isinstance(x, float) for x in angles):
+            seq = angles
+        else:
+            seq = [float(x) for x in angles]
+        out = [seq[0]]
+        for a in seq[1:]:
+            prev = out[-1]
+            diff = (a - prev + half) % period - half
+            out.append(prev + diff)
+        return tuple(out)
+
+    arr = np.asarray(angles, dtype=np.float64)
+    d = np.mod(np.diff(arr) + half, period) - half
+    unwrapped = np.empty_like(arr)
+    unwrapped[0] = arr[0]
+    np.cumsum(d, out=unwrapped[1:])
+    unwrapped[1:] += arr[0]
+    return tuple(unwrapped.tolist())
 
 
 def unwrap_relative(val: float, target: float, *, period: float = 360.0) -> float:
@@ -40,25 +69,37 @@ def unwrap_relative(val: float, target: float, *, period: float = 360.0) -> floa
 
     Keeps (val - target) in [-period/2, +period/2].
     """
-    v = float(val)
     t = float(target)
     p = float(period)
-    half = p / 2.0
-    diff = (v - t + half) % p - half
-    return t + diff
+    # centered floor form: round (val - target) to the nearest period, no branch
+    d = float(val) - t
+    return t + (d - p * floor(d / p + 0.5))
 
 
 def extend_angle_range(
     angles: Iterable[float], *, span: float = 360.0, period: float = 360.0
-) -> List[float]:
-    """Extend angles by adding +period copies until covered span >= span."""
-    base = [float(x) for x in angles]
+) -> Tuple[float, ...]:
+    """Extend angles by adding +period copies until covered span >= span.
+
+    Copy i is ``base + i * period``; the number of copies is computed up
+    front instead of rescanning a growing list.
+    """
+    base = tuple(float(x) for x in angles)
     if not base:
-        return []
-    ext = base[:]
-    while max(ext) - min(ext) < float(span):
-        ext += [a + float(period) for a in base]
-    return ext
+        return ()
+    covered = max(base) - min(base)
+    span = float(span)
+    period = float(period)
+    if covered >= span:
+        return base
+    if period <= 0.0:
+        raise ValueError("period must be > 0 to extend the covered span.")
+
+    copies = math.ceil((span - covered) / period)
+    if len(base) > 16:
+        grid = np.asarray(base)[None, :] + period * np.arange(copies + 1, dtype=np.float64)[:, None]
+        return tuple(grid.ravel().tolist())
+    return tuple(a + i * period for i in range(copies + 1) for a in base)
 
 
 __all__ = [
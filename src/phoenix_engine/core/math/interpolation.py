@@ -2,10 +2,236 @@ from __future__ import annotations
 
 """Interpolation helpers for Panchanga calculations."""
 
-from typing import Iterable, List
+import math
+from functools import lru_cache
+from heapq import nsmallest
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 
-def inverse_lagrange(
+from phoenix_engine.core.jit import HAS_NUMBA, SAFE_FASTMATH, njit
+
+
+def _inverse_lagrange_py(xs: Sequence[float], ys: Sequence[float], yt: float, eps: float) -> float:
+    """Pure-Python barycentric evaluation on an already selected node window."""
+    n = len(xs)
+
+    # exact-hit shortcut
+    for xi, yi in zip(xs, ys):
+        if abs(yt - yi) <= eps:
+            return xi
+
+    # single pass: barycentric weights in y-domain w_i = 1 / Π_{j≠i}(y_i - y_j),
+    # duplicate/near-duplicate detection and the rational-form accumulation.
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        yi = ys[i]
+        denom = 1.0
+        for j in range(n):
+            if j == i:
+                continue
+            d = yi - ys[j]
+            if abs(d) <= eps:
+                raise ValueError("Duplicate/near-duplicate y values; inverse interpolation is ill-defined.")
+            denom *= d
+        if abs(denom) <= eps:
+            raise ZeroDivisionError("Ill-conditioned inverse interpolation (denominator too small).")
+        t = 1.0 / (denom * (yt - yi))
+        num += t * xs[i]
+        den += t
+
+    if abs(den) <= eps:
+        raise ZeroDivisionError("Ill-conditioned inverse interpolation (final denominator too small).")
+
+    return num / den
+
+
+def _inverse_lagrange_k5(
+    x0: float, x1: float, x2: float, x3: float, x4: float,
+    y0: float, y1: float, y2: float, y3: float, y4: float,
+    yt: float, eps: float,
+) -> float:
+    """Straight-line (fully unrolled) ``_inverse_lagrange_py`` for the default 5-node window."""
+    d0 = yt - y0
+    d1 = yt - y1
+    d2 = yt - y2
+    d3 = yt - y3
+    d4 = yt - y4
+
+    # exact-hit shortcut
+    if abs(d0) <= eps:
+        return x0
+    if abs(d1) <= eps:
+        return x1
+    if abs(d2) <= eps:
+        return x2
+    if abs(d3) <= eps:
+        return x3
+    if abs(d4) <= eps:
+        return x4
+
+    # pairwise node differences y_i - y_j (i < j)
+    d01 = y0 - y1
+    d02 = y0 - y2
+    d03 = y0 - y3
+    d04 = y0 - y4
+    d12 = y1 - y2
+    d13 = y1 - y3
+    d14 = y1 - y4
+    d23 = y2 - y3
+    d24 = y2 - y4
+    d34 = y3 - y4
+    if (
+        abs(d01) <= eps or abs(d02) <= eps or abs(d03) <= eps or abs(d04) <= eps
+        or abs(d12) <= eps or abs(d13) <= eps or abs(d14) <= eps
+        or abs(d23) <= eps or abs(d24) <= eps or abs(d34) <= eps
+    ):
+        raise ValueError("Duplicate/near-duplicate y values; inverse interpolation is ill-defined.")
+
+    # Π_{j≠i}(y_i - y_j), signs folded in
+    p0 = d01 * d02 * d03 * d04
+    p1 = -d01 * d12 * d13 * d14
+    p2 = d02 * d12 * d23 * d24
+    p3 = -d03 * d13 * d23 * d34
+    p4 = d04 * d14 * d24 * d34
+    if abs(p0) <= eps or abs(p1) <= eps or abs(p2) <= eps or abs(p3) <= eps or abs(p4) <= eps:
+        raise ZeroDivisionError("Ill-conditioned inverse interpolation (denominator too small).")
+
+    t0 = 1.0 / (p0 * d0)
+    t1 = 1.0 / (p1 * d1)
+    t2 = 1.0 / (p2 * d2)
+    t3 = 1.0 / (p3 * d3)
+    t4 = 1.0 / (p4 * d4)
+    den = t0 + t1 + t2 + t3 + t4
+    if abs(den) <= eps:
+        raise ZeroDivisionError("Ill-conditioned inverse interpolation (final denominator too small).")
+
+    return (t0 * x0 + t1 * x1 + t2 * x2 + t3 * x3 + t4 * x4) / den
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH)
+def _inverse_lagrange_nb(xs, ys, yt, eps):  # pragma: no cover - compiled
+    """Compiled twin of ``_inverse_lagrange_py``; returns NaN instead of raising."""
+    n = xs.shape[0]
+    for i in range(n):
+        if abs(yt - ys[i]) <= eps:
+            return xs[i]
+
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        yi = ys[i]
+        denom = 1.0
+        for j in range(n):
+            if j == i:
+                continue
+            d = yi - ys[j]
+            if abs(d) <= eps:
+                return np.nan
+            denom *= d
+        if abs(denom) <= eps:
+            return np.nan
+        t = 1.0 / (denom * (yt - yi))
+        num += t * xs[i]
+        den += t
+
+    if abs(den) <= eps:
+        return np.nan
+    return num / den
+
+
+# Native-code variant of the unrolled 5-node kernel (raises like the Python one).
+_inverse_lagrange_k5_nb = njit(cache=True, fastmath=SAFE_FASTMATH)(_inverse_lagrange_k5)
+
+
+def _barycentric_weights_k5(
+    y0: float, y1: float, y2: float, y3: float, y4: float, eps: float,
+) -> Tuple[float, float, float, float, float]:
+    """Unrolled ``barycentric_weights`` for a 5-node window (same checks as ``_inverse_lagrange_k5``)."""
+    d01 = y0 - y1
+    d02 = y0 - y2
+    d03 = y0 - y3
+    d04 = y0 - y4
+    d12 = y1 - y2
+    d13 = y1 - y3
+    d14 = y1 - y4
+    d23 = y2 - y3
+    d24 = y2 - y4
+    d34 = y3 - y4
+    if (
+        abs(d01) <= eps or abs(d02) <= eps or abs(d03) <= eps or abs(d04) <= eps
+        or abs(d12) <= eps or abs(d13) <= eps or abs(d14) <= eps
+        or abs(d23) <= eps or abs(d24) <= eps or abs(d34) <= eps
+    ):
+        raise ValueError("Duplicate/near-duplicate y values; inverse interpolation is ill-defined.")
+
+    p0 = d01 * d02 * d03 * d04
+    p1 = -d01 * d12 * d13 * d14
+    p2 = d02 * d12 * d23 * d24
+    p3 = -d03 * d13 * d23 * d34
+    p4 = d04 * d14 * d24 * d34
+    if abs(p0) <= eps or abs(p1) <= eps or abs(p2) <= eps or abs(p3) <= eps or abs(p4) <= eps:
+        raise ZeroDivisionError("Ill-conditioned inverse interpolation (denominator too small).")
+    return 1.0 / p0, 1.0 / p1, 1.0 / p2, 1.0 / p3, 1.0 / p4
+
+
+def _inverse_lagrange_weighted_k5(
+    x0: float, x1: float, x2: float, x3: float, x4: float,
+    y0: float, y1: float, y2: float, y3: float, y4: float,
+    w0: float, w1: float, w2: float, w3: float, w4: float,
+    yt: float, eps: float,
+) -> float:
+    """O(5) evaluation of one target on a window with ``_barycentric_weights_k5`` weights."""
+    d0 = yt - y0
+    d1 = yt - y1
+    d2 = yt - y2
+    d3 = yt - y3
+    d4 = yt - y4
+    if abs(d0) <= eps:
+        return x0
+    if abs(d1) <= eps:
+        return x1
+    if abs(d2) <= eps:
+        return x2
+    if abs(d3) <= eps:
+        return x3
+    if abs(d4) <= eps:
+        return x4
+
+    t0 = w0 / d0
+    t1 = w1 / d1
+    t2 = w2 / d2
+    t3 = w3 / d3
+    t4 = w4 / d4
+    den = t0 + t1 + t2 + t3 + t4
+    if abs(den) <= eps:
+        raise ZeroDivisionError("Ill-conditioned inverse interpolation (final denominator too small).")
+    return (t0 * x0 + t1 * x1 + t2 * x2 + t3 * x3 + t4 * x4) / den
+
+
+_barycentric_weights_k5_nb = njit(cache=True, fastmath=SAFE_FASTMATH)(_barycentric_weights_k5)
+_inverse_lagrange_weighted_k5_nb = njit(cache=True, fastmath=SAFE_FASTMATH)(_inverse_lagrange_weighted_k5)
+
+
+def _as_float_array(values: Iterable[float]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _as_float_seq(values: Iterable[float]) -> Sequence[float]:
+    """Return ``values`` untouched if it is already a list/tuple of floats, else a float list."""
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False).tolist()
+    if isinstance(values, (list, tuple)) and all(isinstance(v, float) for v in values):
+        return values
+    return [float(v) for v in values]
+
+
+def inverse_lagrange_core(
     x_list: Iterable[float],
     y_list: Iterable[float],
     y_target: float,
@@ -13,15 +239,55 @@ def inverse_lagrange(
     max_points: int = 5,
     eps: float = 1e-10,
 ) -> float:
-    """Inverse Lagrange interpolation: estimate x such that y(x)=y_target.
+    """Uncached inverse Lagrange interpolation (see ``inverse_lagrange``).
 
     Numerically safer for Panchanga use:
     - Uses barycentric Lagrange form for x as a function of y.
     - Uses only up to `max_points` nearest samples to y_target (local fit).
     - Handles exact-hit nodes and detects duplicate/near-duplicate y.
+
+    With Numba installed the evaluation runs in a compiled kernel; error
+    cases are re-run through the Python path so the same exceptions surface.
     """
-    xs: List[float] = [float(v) for v in x_list]
-    ys: List[float] = [float(v) for v in y_list]
+    yt = float(y_target)
+    k = max(2, int(max_points))
+
+    if HAS_NUMBA:
+        xa = _as_float_array(x_list)
+        ya = _as_float_array(y_list)
+        if xa.shape[0] != ya.shape[0]:
+            raise ValueError("x_list and y_list must be the same length.")
+        if xa.shape[0] < 2:
+            raise ValueError("Need at least 2 points for inverse interpolation.")
+        if xa.shape[0] > k:
+            idx = np.argpartition(np.abs(ya - yt), k - 1)[:k]
+            xa = xa[idx]
+            ya = ya[idx]
+        if xa.shape[0] == 5:
+            return float(_inverse_lagrange_k5_nb(*xa.tolist(), *ya.tolist(), yt, float(eps)))
+        res = _inverse_lagrange_nb(xa, ya, yt, float(eps))
+        if math.isnan(res):
+            return _inverse_lagrange_py(xa.tolist(), ya.tolist(), yt, eps)
+        return float(res)
+
+    if isinstance(x_list, np.ndarray) or isinstance(y_list, np.ndarray):
+        x_list = _as_float_array(x_list)
+        y_list = _as_float_array(y_list)
+        if x_list.shape[0] != y_list.shape[0]:
+            raise ValueError("x_list and y_list must be the same length.")
+        if x_list.shape[0] < 2:
+            raise ValueError("Need at least 2 points for inverse interpolation.")
+        if x_list.shape[0] > k:
+            # O(n) selection in C
+            idx = np.argpartition(np.abs(y_list - yt), k - 1)[:k]
+            x_list = x_list[idx]
+            y_list = y_list[idx]
+        if x_list.shape[0] == 5:
+            return _inverse_lagrange_k5(*x_list.tolist(), *y_list.tolist(), yt, eps)
+        return _inverse_lagrange_py(x_list.tolist(), y_list.tolist(), yt, eps)
+
+    xs: Sequence[float] = _as_float_seq(x_list)
+    ys: Sequence[float] = _as_float_seq(y_list)
 
     if len(xs) != len(ys):
         raise ValueError("x_list and y_list must be the same length.")
@@ -29,43 +295,54 @@ def inverse_lagrange(
     if n < 2:
         raise ValueError("Need at least 2 points for inverse interpolation.")
 
-    k = max(2, int(max_points))
     if n > k:
-        idx = sorted(range(n), key=lambda i: abs(ys[i] - float(y_target)))[:k]
+        # O(n log k) heap selection instead of a full sort
+        idx = nsmallest(k, range(n), key=lambda i: abs(ys[i] - yt))
         xs = [xs[i] for i in idx]
         ys = [ys[i] for i in idx]
-        n = len(xs)
 
-    yt = float(y_target)
+    if len(xs) == 5:
+        return _inverse_lagrange_k5(*xs, *ys, yt, eps)
+    return _inverse_lagrange_py(xs, ys, yt, eps)
 
-    # exact-hit shortcut
-    for xi, yi in zip(xs, ys):
-        if abs(yt - yi) <= eps:
-            return xi
 
-    # duplicate/near-duplicate y check
+def barycentric_weights(ys: Sequence[float], eps: float = 1e-10) -> List[float]:
+    """Inverse-interpolation weights ``w_i = 1 / prod_{j != i}(y_i - y_j)`` for a node window."""
+    n = len(ys)
+    weights: List[float] = []
     for i in range(n):
-        for j in range(i + 1, n):
-            if abs(ys[i] - ys[j]) <= eps:
-                raise ValueError("Duplicate/near-duplicate y values; inverse interpolation is ill-defined.")
-
-    # barycentric weights in y-domain: w_i = 1 / Π_{j≠i}(y_i - y_j)
-    w: List[float] = []
-    for i in range(n):
-        denom = 1.0
         yi = ys[i]
+        denom = 1.0
         for j in range(n):
             if j == i:
                 continue
-            denom *= (yi - ys[j])
+            d = yi - ys[j]
+            if abs(d) <= eps:
+                raise ValueError("Duplicate/near-duplicate y values; inverse interpolation is ill-defined.")
+            denom *= d
         if abs(denom) <= eps:
             raise ZeroDivisionError("Ill-conditioned inverse interpolation (denominator too small).")
-        w.append(1.0 / denom)
+        weights.append(1.0 / denom)
+    return weights
+
+
+def inverse_lagrange_weighted(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    weights: Sequence[float],
+    y_target: float,
+    *,
+    eps: float = 1e-10,
+) -> float:
+    """O(n) evaluation on a fixed window with precomputed ``barycentric_weights``."""
+    yt = float(y_target)
+    for xi, yi in zip(xs, ys):
+        if abs(yt - yi) <= eps:
+            return xi
 
-    # evaluate barycentric rational form
     num = 0.0
     den = 0.0
-    for xi, yi, wi in zip(xs, ys, w):
+    for xi, yi, wi in zip(xs, ys, weights):
         t = wi / (yt - yi)
         num += t * xi
         den += t
@@ -76,4 +353,90 @@ def inverse_lagrange(
     return num / den
 
 
-__all__ = ["inverse_lagrange"]
+# Root searches re-run the same sample windows; keyed on hashable tuples.
+# Cleared per session by SwissContext.__exit__.
+inverse_lagrange_cached = lru_cache(maxsize=4096)(inverse_lagrange_core)
+
+
+def inverse_lagrange(
+    x_list: Iterable[float],
+    y_list: Iterable[float],
+    y_target: float,
+    *,
+    max_points: int = 5,
+    eps: float = 1e-10,
+) -> float:
+    """Inverse Lagrange interpolation: estimate x such that y(x)=y_target.
+
+    Memoized front end of ``inverse_lagrange_core``: samples are rounded to
+    12 decimals and the target to 9, so near-identical windows share entries.
+    """
+    xs_t = tuple(round(float(v), 12) for v in x_list)
+    ys_t = tuple(round(float(v), 12) for v in y_list)
+    return inverse_lagrange_cached(
+        xs_t, ys_t, round(float(y_target), 9), max_points=int(max_points), eps=float(eps)
+    )
+
+
+def inverse_lagrange_many(
+    x_list: Iterable[float],
+    y_list: Iterable[float],
+    y_targets: Iterable[float],
+    *,
+    max_points: int = 5,
+    eps: float = 1e-10,
+) -> List[float]:
+    """``inverse_lagrange_core`` for several targets over the same samples.
+
+    Targets are grouped by their nearest-``max_points`` window and each
+    window builds its barycentric weights once (unrolled, and compiled with
+    Numba, for the default 5 nodes); every target then costs O(max_points).
+    """
+    xa = _as_float_array(x_list)
+    ya = _as_float_array(y_list)
+    if xa.shape[0] != ya.shape[0]:
+        raise ValueError("x_list and y_list must be the same length.")
+    n = ya.shape[0]
+    if n < 2:
+        raise ValueError("Need at least 2 points for inverse interpolation.")
+    k = max(2, int(max_points))
+    e = float(eps)
+    weights_k5 = _barycentric_weights_k5_nb if HAS_NUMBA else _barycentric_weights_k5
+    eval_k5 = _inverse_lagrange_weighted_k5_nb if HAS_NUMBA else _inverse_lagrange_weighted_k5
+
+    windows: Dict[Tuple[int, ...], Tuple[List[float], List[float], Optional[Sequence[float]]]] = {}
+    out: List[float] = []
+    for y_target in y_targets:
+        yt = float(y_target)
+        if n > k:
+            idx = tuple(sorted(np.argpartition(np.abs(ya - yt), k - 1)[:k].tolist()))
+        else:
+            idx = tuple(range(n))
+        win = windows.get(idx)
+        if win is None:
+            sel = list(idx)
+            win = windows[idx] = (xa[sel].tolist(), ya[sel].tolist(), None)
+        wx, wy, w = win
+        # exact hits resolve before any weights are built (as in inverse_lagrange_core)
+        hit = next((xi for xi, yi in zip(wx, wy) if abs(yt - yi) <= e), None)
+        if hit is not None:
+            out.append(hit)
+            continue
+        if w is None:
+            w = weights_k5(*wy, e) if len(wy) == 5 else barycentric_weights(wy, e)
+            windows[idx] = (wx, wy, w)
+        if len(wx) == 5:
+            out.append(float(eval_k5(*wx, *wy, *w, yt, e)))
+        else:
+            out.append(inverse_lagrange_weighted(wx, wy, w, yt, eps=e))
+    return out
+
+
+__all__ = [
+    "barycentric_weights",
+    "inverse_lagrange",
+    "inverse_lagrange_cached",
+    "inverse_lagrange_core",
+    "inverse_lagrange_many",
+    "inverse_lagrange_weighted",
+]
@@ -3,10 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Optional, Tuple
 
+import numpy as np
 
-# f(jd) -> (value, speed)
+
+# f(jd) -> (value, speed): the residual and its analytic derivative d(value)/d(jd),
+# per day. Refinement takes Newton steps x - value / speed on it (no finite
+# differences), with the bracket as safeguard.
 ValueSpeedFn = Callable[[float], Tuple[float, float]]
 
+# f_batch(jds) -> (values, speeds) as parallel arrays (SoA), one call per grid
+ValueSpeedBatchFn = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
 
 @dataclass(frozen=True)
 class SolveResult:
@@ -16,6 +23,9 @@ class SolveResult:
     bracket: Optional[Tuple[float, float]] = None
 
 
+_EPS = 2.220446049250313e-16  # float64 machine epsilon
+
+
 class SolverError(RuntimeError):
     pass
 
@@ -28,12 +38,44 @@ class NonConvergenceError(SolverError):
     pass
 
 
-def _sign(x: float) -> int:
-    if x > 0:
-        return 1
-    if x < 0:
-        return -1
-    return 0
+def scalar_from_batch(f_batch: ValueSpeedBatchFn) -> ValueSpeedFn:
+    """Adapt a batch evaluator to the scalar form used by the refinement loops."""
+
+    def f(jd: float) -> Tuple[float, float]:
+        vals, speeds = f_batch(np.array([jd], dtype=np.float64))
+        return float(vals[0]), float(speeds[0])
+
+    return f
+
+
+def bracket_root_batch(
+    f_batch: ValueSpeedBatchFn,
+    start_jd: float,
+    end_jd: float,
+    *,
+    step_days: float,
+) -> Tuple[float, float]:
+    """
+    Vectorized bracket_root: evaluate the whole scan grid in one call and
+    locate the first sign change with NumPy.
+    """
+    if end_jd <= start_jd:
+        raise ValueError("end_jd must be > start_jd")
+    if step_days <= 0:
+        raise ValueError("step_days must be > 0")
+
+    jds = np.append(np.arange(float(start_jd), float(end_jd), float(step_days)), float(end_jd))
+    vals, _ = f_batch(jds)
+    signs = np.sign(np.asarray(vals, dtype=np.float64))
+    if signs[0] == 0:
+        return (float(jds[0]), float(jds[0]))
+    change = np.flatnonzero(np.diff(signs))
+    if change.size == 0:
+        raise NoBracketError("No sign change found in [start_jd, end_jd].")
+    i = int(change[0])
+    if signs[i + 1] == 0:
+        return (float(jds[i + 1]), float(jds[i + 1]))
+    return (float(jds[i]), float(jds[i + 1]))
 
 
 def bracket_root(
@@ -42,11 +84,17 @@ def bracket_root(
     end_jd: float,
     *,
     step_days: float,
+    f_batch: Optional[ValueSpeedBatchFn] = None,
 ) -> Tuple[float, float]:
     """
     Find [a,b] such that f(a) and f(b) have opposite signs.
     Uses a forward scan with step_days.
+
+    If f_batch is given, the scan is delegated to bracket_root_batch.
     """
+    if f_batch is not None:
+        return bracket_root_batch(f_batch, start_jd, end_jd, step_days=step_days)
+
     if end_jd <= start_jd:
         raise ValueError("end_jd must be > start_jd")
     if step_days <= 0:
@@ -54,21 +102,20 @@ def bracket_root(
 
     a = float(start_jd)
     va, _ = f(a)
-    sa = _sign(va)
-    if sa == 0:
+    if va == 0.0:
         return (a, a)
 
     x = a
     while x < end_jd:
         nx = min(x + step_days, end_jd)
         vb, _ = f(nx)
-        sb = _sign(vb)
-        if sb == 0:
+        if vb == 0.0:
             return (nx, nx)
-        if sa != sb:
+        # sign-bit compare: a product of tiny values can underflow to 0.0
+        if (va < 0.0) != (vb < 0.0):
             return (x, nx)
         x = nx
-        va, sa = vb, sb
+        va = vb
 
     raise NoBracketError("No sign change found in [start_jd, end_jd].")
 
@@ -91,14 +138,12 @@ def bisection(
 
     va, _ = f(a)
     vb, _ = f(b)
-    sa = _sign(va)
-    sb = _sign(vb)
 
-    if sa == 0:
+    if va == 0.0:
         return SolveResult(root_jd=a, method="bisection", iterations=0, bracket=(a, b))
-    if sb == 0:
+    if vb == 0.0:
         return SolveResult(root_jd=b, method="bisection", iterations=0, bracket=(a, b))
-    if sa == sb:
+    if (va < 0.0) == (vb < 0.0):
         raise NoBracketError("Bisection requires opposite signs at endpoints.")
 
     it = 0
@@ -107,18 +152,88 @@ def bisection(
     while it < max_iter and (hi - lo) > tol_days:
         mid = (lo + hi) / 2.0
         vm, _ = f(mid)
-        sm = _sign(vm)
-        if sm == 0:
+        if vm == 0.0:
             return SolveResult(root_jd=mid, method="bisection", iterations=it + 1, bracket=(a, b))
-        if sm == _sign(vlo):
-            lo, vlo = mid, vm
-        else:
+        if (vlo < 0.0) != (vm < 0.0):
             hi, vhi = mid, vm
+        else:
+            lo, vlo = mid, vm
         it += 1
 
     return SolveResult(root_jd=(lo + hi) / 2.0, method="bisection", iterations=it, bracket=(a, b))
 
 
+def brent(
+    f: ValueSpeedFn,
+    a: float,
+    b: float,
+    *,
+    tol_days: float,
+    max_iter: int = 80,
+) -> SolveResult:
+    """
+    Brent's method on value only: inverse-quadratic / secant steps with a
+    bisection safeguard. Superlinear on smooth roots where plain bisection is
+    linear, and never worse than bisection by more than a constant factor.
+    """
+    a = float(a)
+    b = float(b)
+    bracket = (min(a, b), max(a, b))
+
+    fa, _ = f(a)
+    fb, _ = f(b)
+    if fa == 0.0:
+        return SolveResult(root_jd=a, method="brent", iterations=0, bracket=bracket)
+    if fb == 0.0:
+        return SolveResult(root_jd=b, method="brent", iterations=0, bracket=bracket)
+    if (fa < 0.0) == (fb < 0.0):
+        raise NoBracketError("Brent requires opposite signs at endpoints.")
+
+    c, fc = b, fb
+    d = e = b - a
+    for it in range(1, max_iter + 1):
+        if (fb < 0.0) == (fc < 0.0):
+            # root lies between a and b again
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2.0 * _EPS * abs(b) + 0.5 * tol_days
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return SolveResult(root_jd=b, method="brent", iterations=it, bracket=bracket)
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # secant
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                # inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else (tol1 if xm > 0.0 else -tol1)
+        fb, _ = f(b)
+
+    raise NonConvergenceError("Brent did not converge within max_iter.")
+
+
 def newton_speed_assisted(
     f: ValueSpeedFn,
     x0: float,
@@ -130,50 +245,83 @@ def newton_speed_assisted(
 ) -> SolveResult:
     """
     Newton-Raphson using speed (derivative) returned by f.
-    If bracket is provided, keep iterates inside it (clamp).
+
+    If bracket is provided, run a safeguarded Newton/bisection hybrid: the
+    bracket [lo, hi] is shrunk by sign after every evaluation, and a Newton
+    step is only taken when it lands inside the bracket and converges faster
+    than bisection would (rtsafe criterion); otherwise the iterate bisects. This keeps Newton's
+    quadratic convergence near the root and bisection's worst-case rate.
     """
     x = float(x0)
-    a: Optional[float] = None
-    b: Optional[float] = None
-    if bracket is not None:
-        a, b = float(bracket[0]), float(bracket[1])
-        if b < a:
-            a, b = b, a
-        # clamp initial point
-        if x < a:
-            x = a
-        elif x > b:
-            x = b
-
+    if bracket is None:
+        for it in range(1, max_iter + 1):
+            v, spd = f(x)
+            if abs(v) <= 1e-14:
+                return SolveResult(root_jd=x, method="newton", iterations=it, bracket=bracket)
+
+            if abs(spd) < min_speed:
+                raise NonConvergenceError("Newton derivative too small (stationary / ill-conditioned).")
+
+            nx = x - v / spd
+
+            # Convergence on x-step
+            if abs(nx - x) <= tol_days:
+                return SolveResult(root_jd=nx, method="newton", iterations=it, bracket=bracket)
+            x = nx
+
+        raise NonConvergenceError("Newton did not converge within max_iter.")
+
+    lo, hi = float(bracket[0]), float(bracket[1])
+    if hi < lo:
+        lo, hi = hi, lo
+    # clamp initial point
+    if x < lo:
+        x = lo
+    elif x > hi:
+        x = hi
+
+    vlo, _ = f(lo)
+    if vlo == 0.0:
+        return SolveResult(root_jd=lo, method="newton", iterations=0, bracket=bracket)
+
+    dx = dx_old = hi - lo
     for it in range(1, max_iter + 1):
         v, spd = f(x)
-        if abs(v) <= 1e-14:
+        # no small-residual shortcut here: convergence is judged on x, which
+        # stays meaningful for flat (stationary) roots
+        if v == 0.0:
             return SolveResult(root_jd=x, method="newton", iterations=it, bracket=bracket)
 
-        if abs(spd) < min_speed:
-            raise NonConvergenceError("Newton derivative too small (stationary / ill-conditioned).")
-
-        dx = v / spd
-        nx = x - dx
+        # keep the sign change inside [lo, hi]
+        if (v < 0.0) == (vlo < 0.0):
+            lo = x
+        else:
+            hi = x
+
+        # Newton only if it lands strictly inside (lo, hi) and shrinks faster
+        # than the step before last; otherwise bisect.
+        if (
+            abs(spd) >= min_speed
+            and ((x - hi) * spd - v) * ((x - lo) * spd - v) < 0.0
+            and abs(2.0 * v) <= abs(dx_old * spd)
+        ):
+            dx_old, dx = dx, v / spd
+            nx = x - dx
+        else:
+            dx_old, dx = dx, 0.5 * (hi - lo)
+            nx = lo + dx
 
         # Convergence on x-step
-        if abs(nx - x) <= tol_days:
+        if abs(dx) <= tol_days:
             return SolveResult(root_jd=nx, method="newton", iterations=it, bracket=bracket)
 
-        # If bracketed, clamp iterate (keeps safety)
-        if a is not None and b is not None:
-            if nx < a:
-                nx = a
-            elif nx > b:
-                nx = b
-
         x = nx
 
     raise NonConvergenceError("Newton did not converge within max_iter.")
 
 
 def solve_root(
-    f: ValueSpeedFn,
+    f: Optional[ValueSpeedFn],
     start_jd: float,
     end_jd: float,
     *,
@@ -182,18 +330,27 @@ def solve_root(
     newton_max_iter: int = 20,
     bisection_max_iter: int = 80,
     min_speed: float = 1e-10,
+    f_batch: Optional[ValueSpeedBatchFn] = None,
 ) -> SolveResult:
     """
     Hybrid solver:
-      1) Bracket using scan steps.
-      2) Try speed-assisted Newton inside bracket (fast).
-      3) Fallback to bisection (robust).
+      1) Bracket using scan steps (vectorized when f_batch is given).
+      2) Safeguarded Newton/bisection hybrid inside the bracket (fast).
+      3) Fallback to Brent if the hybrid runs out of iterations, with
+         bisection as the last resort.
+
+    If only f_batch is supplied (f is None), refinement evaluates it one
+    sample at a time through scalar_from_batch.
 
     All time values are in Julian Days (UT or TT depending on caller convention).
     """
+    if f is None:
+        if f_batch is None:
+            raise ValueError("solve_root needs f or f_batch")
+        f = scalar_from_batch(f_batch)
     tol_days = float(accuracy_seconds) / 86400.0
 
-    a, b = bracket_root(f, start_jd, end_jd, step_days=scan_step_days)
+    a, b = bracket_root(f, start_jd, end_jd, step_days=scan_step_days, f_batch=f_batch)
     if a == b:
         return SolveResult(root_jd=a, method="bracket_hit", iterations=0, bracket=(a, b))
 
@@ -211,11 +368,16 @@ def solve_root(
         )
         return SolveResult(root_jd=res.root_jd, method="newton", iterations=res.iterations, bracket=(a, b))
     except (NonConvergenceError, NoBracketError):
-        # fallback robust
+        pass
+
+    # fallback: superlinear Brent, then plain bisection as last resort
+    try:
+        return brent(f, a, b, tol_days=tol_days, max_iter=bisection_max_iter)
+    except NonConvergenceError:
         return bisection(
             f,
             a,
             b,
             tol_days=tol_days,
             max_iter=bisection_max_iter,
-        )
\ No newline at end of file
+        )
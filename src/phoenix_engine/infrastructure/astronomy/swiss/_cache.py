@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+"""Process-wide memo for ``rise_trans`` shared by every provider.
+
+Providers are session-local, so their L1 caches start cold in each
+``SwissContext``; sessions that differ only in policy the rise/set call
+does not read (ayanamsa, nodes, ...) still ask Swiss for the same event.
+Entries are keyed on ``(namespace, key)``: the namespace pins the Swiss
+build and ephemeris path, the key is the provider's full per-call rise/set
+key (the same one the disk cache uses). Lookups happen under the global
+Swiss lock held by ``SwissContext``.
+"""
+
+from typing import Any, MutableMapping, Tuple
+
+from phoenix_engine.core.lru import make_lru
+
+SHARED_RISE_SET_MAXSIZE = 8192
+
+_rise_set: MutableMapping[Tuple[str, Tuple[Any, ...]], Tuple[float, int]] = make_lru(SHARED_RISE_SET_MAXSIZE)
+
+
+def shared_rise_set_cache() -> MutableMapping[Tuple[str, Tuple[Any, ...]], Tuple[float, int]]:
+    return _rise_set
+
+
+def clear_shared_caches() -> None:
+    _rise_set.clear()
+
+
+__all__ = ["SHARED_RISE_SET_MAXSIZE", "clear_shared_caches", "shared_rise_set_cache"]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+"""Persistent (cross-session) cache for ``rise_trans`` results.
+
+``rise_trans`` runs its own root search over many ephemeris evaluations,
+so it is the most expensive Swiss call we make. Results are stored in a
+small SQLite file keyed on the provider's rise/set cache key plus a
+namespace (Swiss version, ephemeris path and its file set), and the least
+recently used rows are evicted past ``max_entries``. Hits only record their
+recency in memory; the ``used`` column is written in one batch before an
+eviction, on close, or every ``_TOUCH_FLUSH`` hits.
+"""
+
+import os
+import sqlite3
+from typing import Any, Dict, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rise_set (
+    key  TEXT PRIMARY KEY,
+    jd   REAL NOT NULL,
+    flag INTEGER NOT NULL,
+    used INTEGER NOT NULL
+)
+"""
+
+# pending recency updates kept in memory before one batched UPDATE
+_TOUCH_FLUSH = 1024
+
+
+def default_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "phoenix_engine", "rise_set")
+
+
+class RiseSetDiskCache:
+    def __init__(self, directory: Optional[str] = None, *, namespace: str = "", max_entries: int = 1_000_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1.")
+        directory = directory or default_cache_dir()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "rise_set.sqlite3")
+        self.namespace = namespace
+        self.max_entries = int(max_entries)
+
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM rise_set").fetchone()[0]
+        self._clock = self._conn.execute("SELECT COALESCE(MAX(used), 0) FROM rise_set").fetchone()[0]
+        self._touched: Dict[str, int] = {}
+
+    def _key(self, key: Tuple[Any, ...]) -> str:
+        # repr of ints/strs is stable across processes (unlike hash())
+        return f"{self.namespace}|{key!r}"
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[float, int]]:
+        k = self._key(key)
+        row = self._conn.execute("SELECT jd, flag FROM rise_set WHERE key = ?", (k,)).fetchone()
+        if row is None:
+            return None
+        self._touched[k] = self._tick()
+        if len(self._touched) >= _TOUCH_FLUSH:
+            self._flush_touches()
+        return float(row[0]), int(row[1])
+
+    def put(self, key: Tuple[Any, ...], value: Tuple[float, int]) -> None:
+        k = self._key(key)
+        row = (k, float(value[0]), int(value[1]), self._tick())
+        self._touched.pop(k, None)
+        # count only real inserts: a replaced row leaves the size unchanged
+        cur = self._conn.execute(
+            "INSERT INTO rise_set (key, jd, flag, used) VALUES (?, ?, ?, ?) ON CONFLICT(key) DO NOTHING", row
+        )
+        if cur.rowcount == 1:
+            self._count += 1
+        else:
+            self._conn.execute("UPDATE rise_set SET jd = ?, flag = ?, used = ? WHERE key = ?", row[1:] + (k,))
+        if self._count > self.max_entries:
+            self._evict()
+
+    def _flush_touches(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE rise_set SET used = ? WHERE key = ?", [(t, k) for k, t in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        self._flush_touches()
+        # drop ~10% beyond the bound in one statement, oldest `used` first
+        excess = self._count - self.max_entries + max(1, self.max_entries // 10)
+        self._conn.execute(
+            "DELETE FROM rise_set WHERE key IN (SELECT key FROM rise_set ORDER BY used LIMIT ?)",
+            (excess,),
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM rise_set").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._flush_touches()
+        self._conn.close()
+
+
+__all__ = ["RiseSetDiskCache", "default_cache_dir"]
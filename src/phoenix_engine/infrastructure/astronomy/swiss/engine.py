@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Tuple, Any, Optional
 
+import numpy as np
 import swisseph as swe
 
 
@@ -52,6 +53,19 @@ class SwissEngine:
             speed_dist=float(xx[5]) if len(xx) > 5 else 0.0,
         )
 
+    def calc_ut_batch(self, jd_uts: np.ndarray, body_id: int, flags: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Longitude and longitude speed for many instants, as parallel arrays (SoA)."""
+        jds = np.asarray(jd_uts, dtype=np.float64)
+        lons = np.empty_like(jds)
+        speeds = np.empty_like(jds)
+        calc = swe.calc_ut
+        for i, jd in enumerate(jds.tolist()):
+            xx = calc(jd, body_id, flags)[0]
+            lons[i] = xx[0]
+            speeds[i] = xx[3]
+        np.mod(lons, 360.0, out=lons)
+        return lons, speeds
+
     def houses_ex(
         self, jd_ut: float, lat: float, lon: float, hsys: bytes, flags: int
     ) -> Tuple[List[float], List[float]]:
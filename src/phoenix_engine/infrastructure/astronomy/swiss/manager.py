@@ -1,10 +1,12 @@
 from __future__ import annotations
 import os, threading, warnings
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import swisseph as swe
 from phoenix_engine.core.config.calibration import CalibrationConfig, AyanamsaMode
+from phoenix_engine.core.math.interpolation import inverse_lagrange_cached
 from phoenix_engine.domain.enums import PerspectiveType, ZodiacType
+from .disk_cache import RiseSetDiskCache
 from .engine import SwissEngine 
 
 _GLOBAL_SWISS_LOCK = threading.RLock()
@@ -12,17 +14,24 @@ _GLOBAL_SWISS_LOCK = threading.RLock()
 @dataclass(frozen=True)
 class SwissAssets:
     ephe_path: str
+    # sorted "name:size" of the .se1 files; empty -> Moshier fallback
+    ephe_files: Tuple[str, ...] = ()
 
 def _default_ephe_path() -> str:
     return os.path.join(os.getcwd(), "ephe")
 
+def _ephemeris_files(path: str) -> Tuple[str, ...]:
+    try:
+        with os.scandir(path) as it:
+            return tuple(sorted(f"{e.name}:{e.stat().st_size}" for e in it if e.name.endswith(".se1")))
+    except OSError:
+        return ()
+
 def ensure_ephemeris_path(ephe_path: Optional[str]) -> SwissAssets:
     path = ephe_path or _default_ephe_path()
     os.makedirs(path, exist_ok=True)
-    has_se1 = False
-    if os.path.exists(path):
-        try: has_se1 = any(f.endswith(".se1") for f in os.listdir(path))
-        except OSError: pass
+    files = _ephemeris_files(path)
+    has_se1 = bool(files)
     
     if not has_se1:
         # SYNTAX FIXED HERE (Clean strings)
@@ -30,7 +39,7 @@ def ensure_ephemeris_path(ephe_path: Optional[str]) -> SwissAssets:
             f"Swiss Ephemeris path {path} is empty. Engine will fall back to Moshier mode.",
             RuntimeWarning
         )
-    return SwissAssets(ephe_path=path)
+    return SwissAssets(ephe_path=path, ephe_files=files)
 
 class SwissContext:
     def __init__(self, config: CalibrationConfig, *, ephe_path: Optional[str] = None, lon: float = 0.0, lat: float = 0.0, alt_m: float = 0.0):
@@ -40,6 +49,8 @@ class SwissContext:
         self._lock = _GLOBAL_SWISS_LOCK
         self._engine = SwissEngine() # Instantiate Class
         self._topo_used = False
+        self._disk_cache: Optional[RiseSetDiskCache] = None
+        self._provider = None
 
     def __enter__(self):
         self._lock.acquire()
@@ -57,16 +68,38 @@ class SwissContext:
             self._engine.set_topo(self.lon, self.lat, self.alt_m)
             self._topo_used = True
 
+        # namespace for cross-session caches: results depend on the library
+        # build and the ephemeris files (Moshier when there are none)
+        files = ",".join(self.assets.ephe_files) or "moshier"
+        namespace = f"{swe.version}|{self.assets.ephe_path}|{files}"
+        if self.config.use_disk_cache:
+            self._disk_cache = RiseSetDiskCache(
+                self.config.disk_cache_dir,
+                namespace=namespace,
+                max_entries=self.config.disk_cache_max_entries,
+            )
+
         from .provider import EphemerisProvider
         # INJECT ENGINE HERE
-        return EphemerisProvider(config=self.config, engine=self._engine, lon=self.lon, lat=self.lat, alt_m=self.alt_m)
+        self._provider = EphemerisProvider(config=self.config, engine=self._engine, lon=self.lon, lat=self.lat,
+                                           alt_m=self.alt_m, cache_namespace=namespace, disk_cache=self._disk_cache)
+        return self._provider
 
     def __exit__(self, exc_type, exc, tb):
         try:
             if self._topo_used and self.config.reset_topo_on_exit:
                 self._engine.set_topo(0.0, 0.0, 0.0)
         finally:
+            # session-local memo; next session starts cold
+            inverse_lagrange_cached.cache_clear()
+            if self._disk_cache is not None:
+                # a provider used past its block falls back to L1/L2 + Swiss
+                if self._provider is not None:
+                    self._provider.disk_cache = None
+                self._disk_cache.close()
+                self._disk_cache = None
+            self._provider = None
             self._lock.release()
 
 # ALIAS FOR BACKWARD COMPATIBILITY (Satisfies GPT Smoke Test)
-SwissContextManager = SwissContext
\ No newline at end of file
+SwissContextManager = SwissContext
@@ -1,97 +1,185 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple, List
+from typing import Any, Dict, MutableMapping, Optional, Tuple, List
 
+import numpy as np
 import swisseph as swe
 
 from phoenix_engine.core.config.calibration import (
+    CacheEviction,
     CalibrationConfig,
+    CalibrationSnapshot,
     NodeMode,
     HouseCalculationMode,
     SunriseDisc,
     RiseSetStyle,
 )
+from phoenix_engine.core.lru import GenerationalDict, make_lru
 from phoenix_engine.domain.enums import ZodiacType, PerspectiveType
 
+from ._cache import shared_rise_set_cache
+from .disk_cache import RiseSetDiskCache
 from .engine import SwissEngine
 
 
-def norm360(x: float) -> float:
-    x = x % 360.0
-    return x + 360.0 if x < 0 else x
-
-
-@dataclass
+# swisseph constants bound once at import (module attribute + int() per call otherwise)
+_SWE_SUN = int(swe.SUN)
+_SWE_MOON = int(swe.MOON)
+_SWE_TRUE_NODE = int(swe.TRUE_NODE)
+_SWE_MEAN_NODE = int(swe.MEAN_NODE)
+_SWE_SWIEPH = int(swe.FLG_SWIEPH)
+_SWE_SPEED = int(swe.FLG_SPEED)
+_SWE_TRUEPOS = int(swe.FLG_TRUEPOS)
+_SWE_SIDEREAL = int(swe.FLG_SIDEREAL)
+_SWE_TOPOCTR = int(swe.FLG_TOPOCTR)
+_SWE_CALC_RISE = int(swe.CALC_RISE)
+_SWE_CALC_SET = int(swe.CALC_SET)
+_SWE_BIT_HINDU_RISING = int(swe.BIT_HINDU_RISING)
+_SWE_BIT_DISC_CENTER = int(swe.BIT_DISC_CENTER)
+_SWE_BIT_DISC_BOTTOM = int(swe.BIT_DISC_BOTTOM)
+_SWE_BIT_NO_REFRACTION = int(swe.BIT_NO_REFRACTION)
+
+# Cache-miss sentinel: lets one ``.get`` replace an ``in`` probe plus a lookup.
+_MISS = object()
+
+
+@dataclass(slots=True)
 class EphemerisProvider:
     """
-    Session-local Swiss Ephemeris provider with mandatory L1 cache.
+    Session-local Swiss Ephemeris provider with mandatory L1 cache
+    (one bounded cache per call type, sized by ``config.cache_maxsize``;
+    LRU by default, generational sweep with ``CacheEviction.GENERATIONAL``).
+    Slotted: hot-path attribute reads are offset loads, not dict probes.
+
+    The config is frozen for the provider's lifetime, so cache keys carry
+    only the per-call varying fields (no signature, no constant flags).
     Expects a pre-configured SwissEngine instance (injected by SwissContext).
+
+    Hot-path invariant: ``jd_ut`` is a float and ``body_id`` an int (as the
+    finders and solvers pass them); no per-call coercion is done.
     """
     config: CalibrationConfig
     engine: SwissEngine
     lon: float = 0.0
     lat: float = 0.0
     alt_m: float = 0.0
-
-    _cache: Dict[Tuple[Any, ...], Any] = field(init=False, default_factory=dict)
-    _sig: Tuple[Any, ...] = field(init=False, default=())
+    # rise_set L2 (process-wide, keyed under this namespace; skipped when
+    # empty) and optional L3 on disk, both shared across sessions (see SwissContext)
+    cache_namespace: str = ""
+    disk_cache: Optional[RiseSetDiskCache] = field(default=None, repr=False)
+
+    _planet_cache: MutableMapping[Tuple[int, int], Tuple[float, float]] = field(init=False, repr=False)
+    _ayan_cache: MutableMapping[int, float] = field(init=False, repr=False)
+    _houses_cache: MutableMapping[Tuple[Any, ...], Any] = field(init=False, repr=False)
+    _rise_set_cache: MutableMapping[Tuple[Any, ...], Tuple[float, int]] = field(init=False, repr=False)
+    # session invariants, resolved once in __post_init__
+    _flags: int = field(init=False, repr=False, default=0)
+    _body_remap: Dict[int, int] = field(init=False, repr=False, default_factory=dict)
+    # PYJHORA_DRiK rise/set fast path (default style)
+    _pyjhora_rise_set: bool = field(init=False, repr=False, default=False)
+    _rsmi_rise: int = field(init=False, repr=False, default=0)
+    _rsmi_set: int = field(init=False, repr=False, default=0)
+    # frozen snapshot of `config`; all per-call policy reads go through it
+    _settings: CalibrationSnapshot = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._sig = tuple(self.config.signature()) if hasattr(self.config, "signature") else ("no-signature",)
+        self._settings = self.config.to_internal()
+        self._planet_cache = self._new_cache()
+        self._ayan_cache = self._new_cache()
+        self._houses_cache = self._new_cache()
+        self._rise_set_cache = self._new_cache()
+        self._flags = self._planet_flags()
+        node_body = _SWE_TRUE_NODE if self._settings.nodes == NodeMode.TRUE else _SWE_MEAN_NODE
+        self._body_remap = {_SWE_TRUE_NODE: node_body, _SWE_MEAN_NODE: node_body}
+        self._pyjhora_rise_set = self._settings.sunrise.style == RiseSetStyle.PYJHORA_DRiK
+        hindu = _SWE_BIT_HINDU_RISING | _SWE_TRUEPOS | _SWE_SPEED
+        self._rsmi_rise = _SWE_CALC_RISE | hindu
+        self._rsmi_set = _SWE_CALC_SET | hindu
 
     # -----------------------
     # Internal helpers
     # -----------------------
-    def _jd_key(self, jd_ut: float, *, ndigits: int = 9) -> float:
-        return round(float(jd_ut), ndigits)
+    def _jd_key(self, jd_ut: float, _scale: float = 1e9) -> int:
+        # 1e-9 day quantum as an int: cheaper than round() and hashes faster
+        return int(jd_ut * _scale)
+
+    def _new_cache(self) -> MutableMapping[Any, Any]:
+        maxsize = self._settings.cache_maxsize
+        if self._settings.cache_eviction == CacheEviction.GENERATIONAL:
+            return GenerationalDict(sweep_every=max(1, maxsize // 2))
+        return make_lru(maxsize)
 
     def _planet_flags(self) -> int:
-        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        cfg = self._settings
+        flags = _SWE_SWIEPH | _SWE_SPEED
 
-        # Robust config access
-        if getattr(self.config, "use_truepos", False):
-            flags |= swe.FLG_TRUEPOS
+        if cfg.use_truepos:
+            flags |= _SWE_TRUEPOS
 
-        if getattr(self.config, "zodiac_type", ZodiacType.TROPICAL) == ZodiacType.SIDEREAL:
-            flags |= swe.FLG_SIDEREAL
+        if cfg.zodiac_type == ZodiacType.SIDEREAL:
+            flags |= _SWE_SIDEREAL
 
-        if (
-            getattr(self.config, "perspective", PerspectiveType.TRUE_GEOCENTRIC) == PerspectiveType.TOPOCENTRIC
-            and getattr(getattr(self.config, "topo", None), "enabled", False)
-        ):
-            flags |= swe.FLG_TOPOCTR
+        if cfg.perspective == PerspectiveType.TOPOCENTRIC and cfg.topo.enabled:
+            flags |= _SWE_TOPOCTR
 
-        return int(flags)
+        return flags
 
     def _map_nodes(self, body_id: int) -> int:
-        if int(body_id) in (int(swe.TRUE_NODE), int(swe.MEAN_NODE)):
-            nodes_mode = getattr(self.config, "nodes", NodeMode.TRUE)
-            return int(swe.TRUE_NODE) if nodes_mode == NodeMode.TRUE else int(swe.MEAN_NODE)
-        return int(body_id)
+        return self._body_remap.get(body_id, body_id)
 
     # -----------------------
     # Public API
     # -----------------------
     def planet_lon_speed(self, jd_ut: float, body_id: int) -> Tuple[float, float]:
-        body = self._map_nodes(body_id)
-        flags = self._planet_flags()
+        body = self._body_remap.get(body_id, body_id)
 
-        key = ("calc_ut", self._sig, self._jd_key(jd_ut), int(body), int(flags))
-        if key in self._cache:
-            return self._cache[key]
+        key = (self._jd_key(jd_ut), body)
+        out = self._planet_cache.get(key, _MISS)
+        if out is not _MISS:
+            return out
 
-        pr = self.engine.calc_ut(float(jd_ut), int(body), int(flags))
-        out = (float(pr.lon), float(pr.speed_lon))
-        self._cache[key] = out
+        pr = self.engine.calc_ut(jd_ut, body, self._flags)
+        out = (pr.lon, pr.speed_lon)
+        self._planet_cache[key] = out
         return out
 
+    def sun_moon_lon_speed(self, jd_ut: float) -> Tuple[float, float, float, float]:
+        """``(sun_lon, sun_speed, moon_lon, moon_speed)`` in one call.
+
+        Same cache entries as two ``planet_lon_speed`` calls, but one frame,
+        one key quantization and one flags lookup (tithi/yoga residuals).
+        """
+        jd_key = self._jd_key(jd_ut)
+        cache = self._planet_cache
+        sun = cache.get((jd_key, _SWE_SUN), _MISS)
+        if sun is _MISS:
+            pr = self.engine.calc_ut(jd_ut, _SWE_SUN, self._flags)
+            sun = (pr.lon, pr.speed_lon)
+            cache[(jd_key, _SWE_SUN)] = sun
+        moon = cache.get((jd_key, _SWE_MOON), _MISS)
+        if moon is _MISS:
+            pr = self.engine.calc_ut(jd_ut, _SWE_MOON, self._flags)
+            moon = (pr.lon, pr.speed_lon)
+            cache[(jd_key, _SWE_MOON)] = moon
+        return sun[0], sun[1], moon[0], moon[1]
+
+    def batch_planet_lon_speed(self, jds: np.ndarray, body_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Uncached ``planet_lon_speed`` over many instants, as parallel arrays (SoA).
+
+        One engine call fills preallocated arrays; meant for scan grids and
+        fixed sampling offsets whose instants are rarely probed twice.
+        """
+        body = self._map_nodes(body_id)
+        return self.engine.calc_ut_batch(np.asarray(jds, dtype=np.float64), body, self._flags)
+
     def ayanamsa(self, jd_ut: float) -> float:
-        key = ("ayan", self._sig, self._jd_key(jd_ut), int(swe.FLG_SWIEPH))
-        if key in self._cache:
-            return self._cache[key]
-        ay = float(self.engine.get_ayanamsa_ex_ut(float(jd_ut), int(swe.FLG_SWIEPH)))
-        self._cache[key] = ay
+        key = self._jd_key(jd_ut)
+        ay = self._ayan_cache.get(key, _MISS)
+        if ay is not _MISS:
+            return ay
+        ay = self.engine.get_ayanamsa_ex_ut(jd_ut, _SWE_SWIEPH)
+        self._ayan_cache[key] = ay
         return ay
 
     def houses(
@@ -101,30 +189,30 @@ class EphemerisProvider:
         *,
         house_mode: Optional[HouseCalculationMode] = None,
     ) -> Tuple[List[float], List[float]]:
-        mode = house_mode or getattr(self.config, "houses", HouseCalculationMode.TROPICAL_DERIVED)
+        mode = house_mode or self._settings.houses
 
         if mode == HouseCalculationMode.TROPICAL_DERIVED:
-            key = ("houses_trop", self._sig, self._jd_key(jd_ut), round(self.lat, 8), round(self.lon, 8), hsys)
-            if key in self._cache:
-                cusps, ascmc = self._cache[key]
-            else:
-                cusps, ascmc = self.engine.houses_ex(float(jd_ut), float(self.lat), float(self.lon), hsys, int(swe.FLG_SWIEPH))
-                self._cache[key] = (cusps, ascmc)
-
-            ay = self.ayanamsa(jd_ut)
-            cusps2 = [norm360(float(c) - ay) for c in cusps]
-            ascmc2 = [norm360(float(a) - ay) for a in ascmc]
-            return cusps2, ascmc2
+            key = ("trop", self._jd_key(jd_ut), int(self.lat * 1e8), int(self.lon * 1e8), hsys)
+            # the cache holds the ayanamsa-corrected result, not the raw Swiss output
+            cached = self._houses_cache.get(key, _MISS)
+            if cached is _MISS:
+                cusps, ascmc = self.engine.houses_ex(jd_ut, self.lat, self.lon, hsys, _SWE_SWIEPH)
+                arr = np.asarray(cusps + ascmc, dtype=np.float64)
+                arr -= self.ayanamsa(jd_ut)
+                np.mod(arr, 360.0, out=arr)
+                n = len(cusps)
+                cached = self._houses_cache[key] = (tuple(arr[:n].tolist()), tuple(arr[n:].tolist()))
+            # immutable cache entry, fresh lists per caller
+            return list(cached[0]), list(cached[1])
 
         # SIDEREAL_NATIVE
-        flags = int(swe.FLG_SWIEPH | swe.FLG_SIDEREAL)
-        key = ("houses_sid", self._sig, self._jd_key(jd_ut), round(self.lat, 8), round(self.lon, 8), hsys, flags)
-        if key in self._cache:
-            return self._cache[key]
-
-        cusps, ascmc = self.engine.houses_ex(float(jd_ut), float(self.lat), float(self.lon), hsys, flags)
-        self._cache[key] = (cusps, ascmc)
-        return cusps, ascmc
+        flags = _SWE_SWIEPH | _SWE_SIDEREAL
+        key = ("sid", self._jd_key(jd_ut), int(self.lat * 1e8), int(self.lon * 1e8), hsys)
+        cached = self._houses_cache.get(key, _MISS)
+        if cached is _MISS:
+            cusps, ascmc = self.engine.houses_ex(jd_ut, self.lat, self.lon, hsys, flags)
+            cached = self._houses_cache[key] = (tuple(cusps), tuple(ascmc))
+        return list(cached[0]), list(cached[1])
 
     def rise_set(
         self,
@@ -135,76 +223,86 @@ class EphemerisProvider:
         atpress: Optional[float] = None,
         attemp: Optional[float] = None,
     ) -> Tuple[float, int]:
-        sunrise_cfg = getattr(self.config, "sunrise", None)
-        style = getattr(sunrise_cfg, "style", RiseSetStyle.PYJHORA_DRiK)
-
-        if style == RiseSetStyle.PYJHORA_DRiK:
-            ephe_flags = 0
-            rsmi = int(swe.CALC_RISE if rise else swe.CALC_SET)
-            rsmi |= int(swe.BIT_HINDU_RISING)
-            rsmi |= int(swe.FLG_TRUEPOS)
-            rsmi |= int(swe.FLG_SPEED)
-
-            rounded_geo = (round(self.lon, 6), round(self.lat, 6), 0.0)
-            key = (
-                "rise_set",
-                self._sig,
-                round(float(jd_ut), 9),
-                int(body_id),
-                bool(rise),
-                int(ephe_flags),
-                int(rsmi),
-                rounded_geo,
-            )
-            if key in self._cache:
-                return self._cache[key]
-
-            geopos = (float(self.lon), float(self.lat), 0.0)
-            out = self.engine.rise_trans(float(jd_ut), int(body_id), ephe_flags, rsmi, geopos, None, None)
-            self._cache[key] = out
-            return out
+        if self._pyjhora_rise_set:
+            rsmi = self._rsmi_rise if rise else self._rsmi_set
+            # lon/lat are settable, so the quantized position is read per call
+            key = (self._jd_key(jd_ut), body_id, rsmi, round(self.lon * 1e6), round(self.lat * 1e6))
+            cached = self._rise_set_cache.get(key, _MISS)
+            if cached is not _MISS:
+                return cached
+            return self._rise_set_pyjhora_miss(jd_ut, body_id, rsmi, key)
 
-        # DISC_POLICY (legacy)
-        ephe_flags = int(swe.FLG_SWIEPH)
-        rsmi = int(swe.CALC_RISE if rise else swe.CALC_SET)
+        sunrise_cfg = self._settings.sunrise
 
-        # FIX: Default to DISC_EDGE (Upper Limb) matching domain/enums.py
-        disc = getattr(sunrise_cfg, "disc", SunriseDisc.DISC_EDGE)
-        use_refrac = getattr(sunrise_cfg, "use_refraction", True)
+        # DISC_POLICY (legacy)
+        ephe_flags = _SWE_SWIEPH
+        rsmi = _SWE_CALC_RISE if rise else _SWE_CALC_SET
 
-        if disc == SunriseDisc.DISC_CENTER:
-            rsmi |= int(swe.BIT_DISC_CENTER)
+        if sunrise_cfg.disc == SunriseDisc.DISC_CENTER:
+            rsmi |= _SWE_BIT_DISC_CENTER
         else:
             # DISC_EDGE implies Upper Limb -> BIT_DISC_BOTTOM
-            rsmi |= int(swe.BIT_DISC_BOTTOM)
-
-        if not use_refrac:
-            rsmi |= int(swe.BIT_NO_REFRACTION)
+            rsmi |= _SWE_BIT_DISC_BOTTOM
 
-        atm = getattr(sunrise_cfg, "atmosphere", None)
-        p_default = getattr(atm, "pressure_mbar", 1013.25)
-        t_default = getattr(atm, "temperature_c", 15.0)
+        if not sunrise_cfg.use_refraction:
+            rsmi |= _SWE_BIT_NO_REFRACTION
 
-        p = float(p_default if atpress is None else atpress)
-        t = float(t_default if attemp is None else attemp)
+        atm = sunrise_cfg.atmosphere
+        p = atm.pressure_mbar if atpress is None else atpress
+        t = atm.temperature_c if attemp is None else attemp
 
-        rounded_geo = (round(self.lon, 6), round(self.lat, 6), round(self.alt_m, 1))
+        rounded_geo = (round(self.lon * 1e6), round(self.lat * 1e6), round(self.alt_m * 10.0))
         key = (
-            "rise_set",
-            self._sig,
-            round(float(jd_ut), 9),
-            int(body_id),
-            bool(rise),
-            int(ephe_flags),
-            int(rsmi),
+            self._jd_key(jd_ut),
+            body_id,
+            ephe_flags,
+            rsmi,
             rounded_geo,
-            round(p, 2),
-            round(t, 2),
+            int(p * 100.0),
+            int(t * 100.0),
         )
-        if key in self._cache:
-            return self._cache[key]
+        cached = self._rise_set_cache.get(key, _MISS)
+        if cached is not _MISS:
+            return cached
+
+        out = self._rise_trans_shared(key, jd_ut, body_id, ephe_flags, rsmi, (self.lon, self.lat, self.alt_m), p, t)
+        self._rise_set_cache[key] = out
+        return out
+
+    def _rise_set_pyjhora_miss(
+        self, jd_ut: float, body_id: int, rsmi: int, key: Tuple[int, int, int, int, int]
+    ) -> Tuple[float, int]:
+        # the shared caches outlive the provider, so their key also carries
+        # the ephemeris flags (same layout as the DISC_POLICY key)
+        l2_key = (key[0], body_id, 0, rsmi, (key[3], key[4], 0))
+        out = self._rise_trans_shared(l2_key, jd_ut, body_id, 0, rsmi, (self.lon, self.lat, 0.0), None, None)
+        self._rise_set_cache[key] = out
+        return out
 
-        geopos = (float(self.lon), float(self.lat), float(self.alt_m))
-        out = self.engine.rise_trans(float(jd_ut), int(body_id), ephe_flags, rsmi, geopos, p, t)
-        self._cache[key] = out
+    def _rise_trans_shared(
+        self,
+        l2_key: Tuple[Any, ...],
+        jd_ut: float,
+        body_id: int,
+        ephe_flags: int,
+        rsmi: int,
+        geopos: Tuple[float, float, float],
+        atpress: Optional[float],
+        attemp: Optional[float],
+    ) -> Tuple[float, int]:
+        # no namespace (provider built outside SwissContext): the ephemeris
+        # behind this engine is unknown, so stay out of the process-wide L2
+        shared = shared_rise_set_cache() if self.cache_namespace else None
+        shared_key = (self.cache_namespace, l2_key)
+        if shared is not None:
+            out = shared.get(shared_key, _MISS)
+            if out is not _MISS:
+                return out
+        out = self.disk_cache.get(l2_key) if self.disk_cache is not None else None
+        if out is None:
+            out = self.engine.rise_trans(jd_ut, body_id, ephe_flags, rsmi, geopos, atpress, attemp)
+            if self.disk_cache is not None:
+                self.disk_cache.put(l2_key, out)
+        if shared is not None:
+            shared[shared_key] = out
         return out
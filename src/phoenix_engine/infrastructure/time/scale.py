@@ -1,23 +1,51 @@
 from __future__ import annotations
 from enum import Enum
+from functools import lru_cache
 import swisseph as swe
 
 class TimeScale(str, Enum):
     UT = "UT"
     TT = "TT"
 
-def delta_t_days(jd_ut: float) -> float:
-    """Returns Delta T in DAYS (calculated automatically via Swiss Ephemeris)."""
-    dt = float(swe.deltat(jd_ut))
+class DeltaTMode(str, Enum):
+    SWISS = "SWISS"  # swe.deltat (tabulated/IERS-backed)
+    QUADRATIC = "QUADRATIC"  # Morrison-Stephenson parabola, no Swiss call
+
+# Julian days per Julian year and the J2000.0 epoch (for the quadratic model)
+_DAYS_PER_YEAR = 365.25
+_J2000 = 2451545.0
+
+@lru_cache(maxsize=4096)
+def _delta_t_swiss(jd_key: float) -> float:
+    dt = float(swe.deltat(jd_key))
     if abs(dt) > 0.5: # Heuristic for seconds
         return dt / 86400.0
     return dt
 
-def ut_to_tt(jd_ut: float) -> float:
-    return jd_ut + delta_t_days(jd_ut)
+def delta_t_quadratic(jd_ut: float) -> float:
+    """Morrison-Stephenson long-term parabola, in DAYS.
+
+    Delta T ~ -20 + 32 u^2 seconds with u = (year - 1820) / 100; good to
+    about a minute over the modern era, no Swiss call.
+    """
+    u = (2000.0 + (float(jd_ut) - _J2000) / _DAYS_PER_YEAR - 1820.0) / 100.0
+    return (-20.0 + 32.0 * u * u) / 86400.0
+
+def delta_t_days(jd_ut: float, mode: DeltaTMode = DeltaTMode.SWISS) -> float:
+    """Returns Delta T in DAYS (Swiss Ephemeris by default, memoized).
+
+    The Swiss value is cached on ``round(jd_ut, 4)`` (~8.6 s); Delta T drifts
+    ~1 s/year, so the rounding is far below any solver tolerance.
+    """
+    if mode == DeltaTMode.QUADRATIC:
+        return delta_t_quadratic(jd_ut)
+    return _delta_t_swiss(round(float(jd_ut), 4))
+
+def ut_to_tt(jd_ut: float, mode: DeltaTMode = DeltaTMode.SWISS) -> float:
+    return jd_ut + delta_t_days(jd_ut, mode)
 
-def tt_to_ut(jd_tt: float) -> float:
-    jd_ut = jd_tt
-    for _ in range(4):
-        jd_ut = jd_tt - delta_t_days(jd_ut)
-    return jd_ut
\ No newline at end of file
+def tt_to_ut(jd_tt: float, mode: DeltaTMode = DeltaTMode.SWISS) -> float:
+    # Seed with the closed-form model, then one correction step: |dDeltaT/dJD|
+    # is ~1e-8, so the seed's (<~1 min) error shrinks below 1e-12 days.
+    jd_ut = jd_tt - delta_t_quadratic(jd_tt)
+    return jd_tt - delta_t_days(jd_ut, mode)
@@ -67,4 +67,24 @@ def test_yoga_end_sanity():
         rem = total % unit
 
         eps = 1e-2
-        assert _near_boundary(rem, unit, eps), f"Yoga remainder {rem} not near boundary"
\ No newline at end of file
+        assert _near_boundary(rem, unit, eps), f"Yoga remainder {rem} not near boundary"
+
+
+def test_find_all_tithi_ends_matches_sequential_search():
+    start_jd, end_jd = 2460310.5, 2460325.5
+    with SwissContextManager(CalibrationConfig()) as provider:
+        finder = PanchangaFinder(provider)
+        ends = finder.find_all_tithi_ends(start_jd, end_jd)
+
+        seq = []
+        jd = start_jd
+        while True:
+            root = finder.next_tithi_end(jd).root_jd
+            if root > end_jd:
+                break
+            seq.append(root)
+            jd = root + 1e-5
+
+    assert len(ends) == len(seq) >= 14
+    for a, b in zip(ends.tolist(), seq):
+        assert abs(a - b) * 86400.0 < 0.2
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import swisseph as swe
+
+from phoenix_engine.core.config.calibration import CalibrationConfig
+from phoenix_engine.infrastructure.astronomy.swiss._cache import clear_shared_caches
+from phoenix_engine.infrastructure.astronomy.swiss.manager import SwissContextManager
+
+
+def test_planet_lookups_hit_per_type_cache():
+    with SwissContextManager(CalibrationConfig()) as provider:
+        first = provider.planet_lon_speed(2460310.5, int(swe.MOON))
+        assert provider.planet_lon_speed(2460310.5, int(swe.MOON)) is first
+        assert len(provider._planet_cache) == 1
+
+        ay = provider.ayanamsa(2460310.5)
+        assert provider.ayanamsa(2460310.5) == ay
+        assert len(provider._ayan_cache) == 1
+
+
+def test_generational_eviction_is_selectable():
+    from phoenix_engine.core.config.calibration import CacheEviction
+    from phoenix_engine.core.lru import GenerationalDict
+
+    cfg = CalibrationConfig(cache_eviction=CacheEviction.GENERATIONAL, cache_maxsize=8)
+    assert cfg.signature() == CalibrationConfig().signature()
+    with SwissContextManager(cfg) as provider:
+        assert isinstance(provider._planet_cache, GenerationalDict)
+        assert provider._planet_cache.sweep_every == 4
+        first = provider.planet_lon_speed(2460310.5, int(swe.MOON))
+        assert provider.planet_lon_speed(2460310.5, int(swe.MOON)) is first
+
+
+def test_sun_moon_lon_speed_shares_planet_cache_entries():
+    with SwissContextManager(CalibrationConfig()) as provider:
+        s, ss, m, ms = provider.sun_moon_lon_speed(2460310.5)
+        assert len(provider._planet_cache) == 2
+        assert provider.planet_lon_speed(2460310.5, int(swe.SUN)) == (s, ss)
+        assert provider.planet_lon_speed(2460310.5, int(swe.MOON)) == (m, ms)
+        assert len(provider._planet_cache) == 2
+
+
+def test_tithi_and_yoga_searches_share_the_start_probe():
+    from phoenix_engine.vedic.panchanga.events import PanchangaFinder
+
+    with SwissContextManager(CalibrationConfig()) as provider:
+        finder = PanchangaFinder(provider)
+        finder.next_tithi_end(2460310.5)
+        before = len(provider._planet_cache)
+        provider.sun_moon_lon_speed(2460310.5)
+        assert len(provider._planet_cache) == before
+
+
+def test_mean_and_true_node_share_entry_after_remap():
+    with SwissContextManager(CalibrationConfig()) as provider:
+        true_node = provider.planet_lon_speed(2460310.5, int(swe.TRUE_NODE))
+        assert provider.planet_lon_speed(2460310.5, int(swe.MEAN_NODE)) is true_node
+
+
+def test_batch_planet_lon_speed_matches_scalar_calls():
+    import numpy as np
+
+    jds = 2460310.5 + np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+    with SwissContextManager(CalibrationConfig()) as provider:
+        lons, speeds = provider.batch_planet_lon_speed(jds, int(swe.MOON))
+        for jd, lon, spd in zip(jds.tolist(), lons.tolist(), speeds.tolist()):
+            assert (lon, spd) == provider.planet_lon_speed(jd, int(swe.MOON))
+
+
+def test_node_remap_follows_config():
+    from phoenix_engine.domain.enums import NodeMode
+
+    with SwissContextManager(CalibrationConfig(nodes=NodeMode.MEAN)) as provider:
+        provider.planet_lon_speed(2460310.5, int(swe.TRUE_NODE))
+        assert list(provider._planet_cache.keys()) == [(provider._jd_key(2460310.5), int(swe.MEAN_NODE))]
+
+
+def test_tropical_derived_houses_are_shifted_by_ayanamsa_and_cached():
+    import pytest
+
+    from phoenix_engine.domain.enums import HouseCalculationMode
+
+    jd = 2460310.5
+    with SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6) as provider:
+        cusps, ascmc = provider.houses(jd, b"P", house_mode=HouseCalculationMode.TROPICAL_DERIVED)
+        raw_cusps, raw_ascmc = provider.engine.houses_ex(jd, 28.6, 77.2, b"P", int(swe.FLG_SWIEPH))
+        ay = provider.ayanamsa(jd)
+
+        assert cusps == pytest.approx([(c - ay) % 360.0 for c in raw_cusps], abs=1e-9)
+        assert ascmc == pytest.approx([(a - ay) % 360.0 for a in raw_ascmc], abs=1e-9)
+        cusps[0] = -1.0  # a caller's edit must not reach the cache
+        assert provider.houses(jd, b"P", house_mode=HouseCalculationMode.TROPICAL_DERIVED)[0][0] != -1.0
+
+
+def test_jd_keys_are_int_quantized():
+    with SwissContextManager(CalibrationConfig()) as provider:
+        key = provider._jd_key(2460310.5)
+        assert isinstance(key, int)
+        assert provider._jd_key(2460310.5 + 1e-6) != key
+
+
+def test_provider_is_slotted():
+    import pytest
+
+    with SwissContextManager(CalibrationConfig()) as provider:
+        assert not hasattr(provider, "__dict__")
+        with pytest.raises(AttributeError):
+            provider.typo_attr = 1
+
+
+def test_rise_set_disk_cache_serves_next_session(tmp_path):
+    cfg = CalibrationConfig(use_disk_cache=True, disk_cache_dir=str(tmp_path))
+
+    with SwissContextManager(cfg, lon=77.2, lat=28.6) as provider:
+        first = provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+
+    clear_shared_caches()  # force the disk path
+    with SwissContextManager(cfg, lon=77.2, lat=28.6) as provider:
+        def _no_swiss(*args, **kwargs):
+            raise AssertionError("rise_trans should be served from the disk cache")
+
+        provider.engine.rise_trans = _no_swiss
+        assert provider.rise_set(2460310.5, int(swe.SUN), rise=True) == first
+
+
+def test_provider_outliving_its_block_drops_the_closed_disk_cache(tmp_path):
+    cfg = CalibrationConfig(use_disk_cache=True, disk_cache_dir=str(tmp_path))
+
+    with SwissContextManager(cfg, lon=77.2, lat=28.6) as provider:
+        assert provider.disk_cache is not None
+    assert provider.disk_cache is None
+    clear_shared_caches()
+    assert provider.rise_set(2460311.5, int(swe.SUN), rise=True)[0] > 2460311.5
+
+
+def test_cache_namespace_tracks_the_ephemeris_file_set(tmp_path):
+    with SwissContextManager(CalibrationConfig(), ephe_path=str(tmp_path)) as provider:
+        moshier_ns = provider.cache_namespace
+    (tmp_path / "seas_18.se1").write_bytes(b"\0" * 16)  # asteroid file: never opened here
+    with SwissContextManager(CalibrationConfig(), ephe_path=str(tmp_path)) as provider:
+        assert provider.cache_namespace != moshier_ns
+
+
+def test_pyjhora_rise_set_fast_path_keys_rise_and_set_apart():
+    with SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6) as provider:
+        rise = provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+        sset = provider.rise_set(2460310.5, int(swe.SUN), rise=False)
+        assert rise[0] != sset[0]
+        assert provider.rise_set(2460310.5, int(swe.SUN), rise=True) is rise
+        assert len(provider._rise_set_cache) == 2
+
+
+def test_rise_set_follows_a_moved_provider():
+    with SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6) as provider:
+        delhi = provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+        provider.lon, provider.lat = -0.1, 51.5
+        london = provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+        assert london[0] != delhi[0]
+        assert london == provider.engine.rise_trans(
+            2460310.5, int(swe.SUN), 0, provider._rsmi_rise, (-0.1, 51.5, 0.0), None, None
+        )
+
+
+def test_provider_without_namespace_stays_out_of_the_shared_cache():
+    from phoenix_engine.infrastructure.astronomy.swiss._cache import shared_rise_set_cache
+    from phoenix_engine.infrastructure.astronomy.swiss.provider import EphemerisProvider
+
+    clear_shared_caches()
+    with SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6) as session:
+        provider = EphemerisProvider(CalibrationConfig(), session.engine, lon=77.2, lat=28.6)
+        provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+        assert len(shared_rise_set_cache()) == 0
+
+
+def test_rise_set_is_shared_across_sessions_with_other_policy():
+    from phoenix_engine.domain.enums import NodeMode
+
+    clear_shared_caches()
+    with SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6) as provider:
+        first = provider.rise_set(2460310.5, int(swe.SUN), rise=True)
+
+    # nodes do not enter rise_trans: the second session is served in-process
+    with SwissContextManager(CalibrationConfig(nodes=NodeMode.MEAN), lon=77.2, lat=28.6) as provider:
+        def _no_swiss(*args, **kwargs):
+            raise AssertionError("rise_trans should be served from the shared cache")
+
+        provider.engine.rise_trans = _no_swiss
+        assert provider.rise_set(2460310.5, int(swe.SUN), rise=True) == first
+
+
+def test_entering_a_session_makes_no_ephemeris_calls():
+    ctx = SwissContextManager(CalibrationConfig(), lon=77.2, lat=28.6)
+
+    def _no_calc(*args, **kwargs):
+        raise AssertionError("__enter__ should not compute positions")
+
+    ctx._engine.calc_ut = _no_calc
+    with ctx as provider:
+        assert provider.engine is ctx._engine
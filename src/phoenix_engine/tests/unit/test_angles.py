@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from phoenix_engine.core.math.angles import extend_angle_range, unwrap_angles
+
+
+def test_unwrap_angles_short_sequence():
+    assert unwrap_angles([340.0, 350.0, 10.0, 20.0]) == (340.0, 350.0, 370.0, 380.0)
+
+
+def test_unwrap_angles_vectorized_matches_scalar():
+    # Moon-like samples (~13 deg/day) crossing 360 twice, long enough for the NumPy path.
+    raw = [(300.0 + 13.2 * i) % 360.0 for i in range(40)]
+    expected = [300.0 + 13.2 * i for i in range(40)]
+
+    out = unwrap_angles(raw)
+    assert out == pytest.approx(expected, abs=1e-9)
+    assert unwrap_angles(iter(raw)) == out
+
+
+def test_unwrap_angles_custom_period():
+    raw = [(25.0 + 0.9 * i) % 27.0 for i in range(12)]
+    out = unwrap_angles(raw, period=27.0)
+    assert out == pytest.approx([25.0 + 0.9 * i for i in range(12)], abs=1e-9)
+
+
+def test_unwrap_angles_empty():
+    assert unwrap_angles([]) == ()
+
+
+def test_extend_angle_range_adds_single_copy():
+    base = [100.0, 103.0, 106.0]
+    assert extend_angle_range(base) == (100.0, 103.0, 106.0, 460.0, 463.0, 466.0)
+
+
+def test_extend_angle_range_already_covered():
+    assert extend_angle_range([0.0, 200.0], span=150.0) == (0.0, 200.0)
+    assert extend_angle_range([]) == ()
+
+
+def test_extend_angle_range_multiple_copies():
+    out = extend_angle_range([10.0, 20.0], span=700.0)
+    assert out == (10.0, 20.0, 370.0, 380.0, 730.0, 740.0)
+    assert max(out) - min(out) >= 700.0
+
+
+def test_extend_angle_range_vectorized_matches():
+    base = [float(i) for i in range(20)]
+    out = extend_angle_range(base, span=400.0)
+    assert out == tuple(a + i * 360.0 for i in range(3) for a in base)
+
+
+def test_unwrap_angles_int_and_array_inputs():
+    import numpy as np
+
+    assert unwrap_angles([340, 350, 10]) == (340.0, 350.0, 370.0)
+    assert unwrap_angles(np.array([340, 350, 10])) == (340.0, 350.0, 370.0)
+
+
+def test_normalize_angle_exact_multiples_and_custom_window():
+    from phoenix_engine.core.math.angles import normalize_angle
+
+    for k in (-3, -1, 0, 1, 2, 1000):
+        assert normalize_angle(360.0 * k) == 0.0
+    assert normalize_angle(-0.5) == 359.5
+    assert normalize_angle(190.0, start=-180.0) == -170.0
+
+
+def test_unwrap_relative_half_period_maps_to_lower_edge():
+    from phoenix_engine.core.math.angles import unwrap_relative
+
+    assert unwrap_relative(195.0, 15.0) == -165.0
+    assert unwrap_relative(15.0 + 720.0 + 10.0, 15.0) == 25.0
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from phoenix_engine.core.config.calibration import CalibrationConfig, CalibrationSnapshot
+from phoenix_engine.domain.enums import NodeMode
+
+
+def test_signature_is_cached_and_dropped_on_copy():
+    cfg = CalibrationConfig()
+    assert cfg.signature() is cfg.signature()
+
+    mean = cfg.model_copy(update={"nodes": NodeMode.MEAN})
+    assert mean.signature() != cfg.signature()
+    assert mean.signature()[5] == NodeMode.MEAN.value
+
+
+def test_snapshot_is_frozen_and_hashable():
+    snap = CalibrationConfig().to_internal()
+    assert isinstance(snap, CalibrationSnapshot)
+    assert snap == CalibrationConfig().to_internal()
+    assert {snap: 1}[CalibrationConfig().to_internal()] == 1
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.use_speed = False  # type: ignore[misc]
+
+
+def test_config_is_frozen_hashable_and_strict():
+    from pydantic import ValidationError
+
+    assert hash(CalibrationConfig()) == hash(CalibrationConfig())
+    with pytest.raises(ValidationError):
+        CalibrationConfig(use_sped=False)  # typo must not be silently ignored
+
+
+def test_cache_maxsize_does_not_change_signature():
+    small = CalibrationConfig(cache_maxsize=16)
+    assert small.signature() == CalibrationConfig().signature()
+    assert small.to_internal().cache_maxsize == 16
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from phoenix_engine.infrastructure.astronomy.swiss.disk_cache import RiseSetDiskCache
+
+
+def test_disk_cache_roundtrip_survives_reopen(tmp_path):
+    key = (2460310500000000, 0, 0, 1, (77209000, 28613900, 0))
+    cache = RiseSetDiskCache(str(tmp_path), namespace="v1")
+    assert cache.get(key) is None
+    cache.put(key, (2460310.55, 0))
+    cache.close()
+
+    reopened = RiseSetDiskCache(str(tmp_path), namespace="v1")
+    assert reopened.get(key) == (2460310.55, 0)
+    assert RiseSetDiskCache(str(tmp_path), namespace="v2").get(key) is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = RiseSetDiskCache(str(tmp_path), max_entries=3)
+    for i in range(3):
+        cache.put((i,), (float(i), 0))
+    cache.get((0,))  # refresh the oldest row
+    cache.put((3,), (3.0, 0))
+
+    assert len(cache) <= 3
+    assert cache.get((0,)) == (0.0, 0)
+    assert cache.get((1,)) is None
+
+
+def test_disk_cache_replace_does_not_grow_the_count(tmp_path):
+    cache = RiseSetDiskCache(str(tmp_path), max_entries=3)
+    for _ in range(5):
+        cache.put((0,), (1.0, 0))
+    cache.put((0,), (2.0, 0))
+    assert len(cache) == 1
+    assert cache.get((0,)) == (2.0, 0)
+
+
+def test_disk_cache_hits_do_not_write_until_flush(tmp_path):
+    cache = RiseSetDiskCache(str(tmp_path))
+    cache.put((0,), (1.0, 0))
+    before = cache._conn.total_changes
+    for _ in range(10):
+        assert cache.get((0,)) == (1.0, 0)
+    assert cache._conn.total_changes == before
+    cache.close()
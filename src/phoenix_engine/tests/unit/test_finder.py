@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from phoenix_engine.vedic.panchanga.finder import MOON, SUN, PanchangaFinder, SearchParams
+
+
+class _LinearProvider:
+    """Sun fixed at 0 deg, Moon moving 12 deg/day from `moon0` at jd=0."""
+
+    def __init__(self, moon0: float, reported_speed: float = 12.0):
+        self.moon0 = moon0
+        self.reported_speed = reported_speed
+
+    def planet_lon_speed(self, jd, body):
+        if body == SUN:
+            return 0.0, 0.0
+        assert body == MOON
+        return (self.moon0 + 12.0 * jd) % 360.0, self.reported_speed
+
+    def sun_moon_lon_speed(self, jd):
+        return (0.0, 0.0) + self.planet_lon_speed(jd, MOON)
+
+    def batch_planet_lon_speed(self, jds, body):
+        jds = np.asarray(jds, dtype=np.float64)
+        if body == SUN:
+            return np.zeros_like(jds), np.zeros_like(jds)
+        return np.mod(self.moon0 + 12.0 * jds, 360.0), np.full_like(jds, 12.0)
+
+
+def test_last_tithi_of_cycle_unwraps_through_zero():
+    # tithi 29.5 at jd=0 -> the 30th boundary (Moon-Sun = 360 deg) half a day later
+    finder = PanchangaFinder(_LinearProvider(moon0=354.0))
+    res = finder.next_tithi_end(0.0)
+    assert res.root_jd == pytest.approx(0.5, abs=1e-6)
+
+
+def test_mid_cycle_tithi_has_no_unwrap():
+    finder = PanchangaFinder(_LinearProvider(moon0=126.0))
+    res = finder.next_tithi_end(0.0)
+    assert res.root_jd == pytest.approx(0.5, abs=1e-6)
+
+
+def test_speed_bracket_falls_back_to_scan_when_eta_misses():
+    # a start speed 3x too high puts the ETA bracket well before the crossing
+    finder = PanchangaFinder(_LinearProvider(moon0=126.0, reported_speed=36.0))
+    res = finder.next_tithi_end(0.0)
+    assert res.root_jd == pytest.approx(0.5, abs=1e-6)
+    assert res.bracket[1] > 1.2 * 0.5 / 3.0  # came from the scan, not [0.15, 0.2]
+
+
+def test_find_all_tithi_ends_covers_the_cycle_wrap():
+    # tithi 29.5 at jd=0, one tithi per day: ends at 0.5 (wrap to 0), 1.5, 2.5
+    finder = PanchangaFinder(_LinearProvider(moon0=354.0))
+    ends = finder.find_all_tithi_ends(0.0, 3.0)
+    assert ends == pytest.approx([0.5, 1.5, 2.5], abs=1e-6)
+
+
+def test_find_all_tithi_ends_resolves_unconverged_roots_per_event():
+    # no batched Newton steps at all: every crossing goes through the scalar solver
+    finder = PanchangaFinder(_LinearProvider(moon0=354.0))
+    ends = finder.find_all_tithi_ends(0.0, 3.0, max_iter=0)
+    assert ends == pytest.approx([0.5, 1.5, 2.5], abs=1e-6)
+
+
+def test_fixed_point_index_integer_part_is_exact_floor():
+    from phoenix_engine.vedic.panchanga.temporal import INDEX_FRACTION_BITS, to_fixed
+
+    vals = np.array([0.0, np.nextafter(1.0, 0.0), 1.0, 29.999999999, 26.5])
+    assert (to_fixed(vals) >> INDEX_FRACTION_BITS).tolist() == np.floor(vals).astype(np.int64).tolist()
+
+
+def test_search_params_are_slotted_and_frozen():
+    import dataclasses
+
+    p = SearchParams()
+    assert not hasattr(p, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        p.accuracy_seconds = 1.0
+
+
+def test_finder_refines_with_newton_on_the_returned_speed():
+    # linear residual: one Newton step from inside the bracket lands on the root
+    # (root at 6.5/12 day, between 1/12-day scan points)
+    finder = PanchangaFinder(_LinearProvider(moon0=125.5))
+    res = finder.next_tithi_end(0.0, params=SearchParams(max_days_ahead=1.5, speed_bracket=False))
+    assert res.method == "newton"
+    assert res.iterations <= 2
+    assert res.root_jd == pytest.approx(6.5 / 12.0, abs=1e-6)
+
+
+def test_prenorm_kernels_match_general_ones_on_normalized_input():
+    from phoenix_engine.vedic.panchanga import temporal as t
+
+    rng = np.random.default_rng(7)
+    for m, s in rng.uniform(0.0, 360.0, size=(200, 2)).tolist():
+        assert t.tithi_continuous_prenorm(m, 13.0, s, 1.0) == pytest.approx(t.tithi_continuous(m, 13.0, s, 1.0))
+        assert t.yoga_continuous_prenorm(m, 13.0, s, 1.0) == pytest.approx(t.yoga_continuous(m, 13.0, s, 1.0))
+        assert t.nakshatra_continuous_prenorm(m, 13.0) == pytest.approx(t.nakshatra_continuous(m, 13.0))
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+
+from phoenix_engine.core.math.interpolation import inverse_lagrange
+
+
+def test_inverse_lagrange_exact_for_polynomial_inverse():
+    # x = y^2 + y is reproduced exactly by a 5-node fit in the y-domain.
+    ys = [0.0, 0.5, 0.8, 1.2, 1.5]
+    xs = [y * y + y for y in ys]
+    assert inverse_lagrange(xs, ys, 1.0) == pytest.approx(2.0, abs=1e-12)
+
+
+def test_inverse_lagrange_exact_hit():
+    assert inverse_lagrange([0.0, 0.25, 0.5], [10.0, 13.0, 16.0], 13.0) == 0.25
+
+
+def test_inverse_lagrange_nearest_points_only():
+    # Far-away samples must not influence the local (linear) fit.
+    xs = [float(i) for i in range(20)]
+    ys = [2.0 * x + 1.0 for x in xs]
+    assert inverse_lagrange(xs, ys, 21.0, max_points=3) == pytest.approx(10.0)
+
+
+def test_inverse_lagrange_duplicate_y_raises():
+    with pytest.raises(ValueError):
+        inverse_lagrange([0.0, 1.0, 2.0], [1.0, 1.0, 3.0], 2.0)
+
+
+def test_inverse_lagrange_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        inverse_lagrange([0.0, 1.0], [1.0], 0.5)
+
+
+def test_inverse_lagrange_array_inputs_match_lists():
+    import numpy as np
+
+    xs = [0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75]
+    ys = [10.0 + 13.0 * x + 0.4 * x * x for x in xs]
+    expected = inverse_lagrange(xs, ys, 22.0)
+    assert inverse_lagrange(np.array(xs), np.array(ys), 22.0) == pytest.approx(expected, abs=1e-12)
+
+
+def test_unrolled_five_node_kernel_matches_generic():
+    import random
+
+    from phoenix_engine.core.math.interpolation import _inverse_lagrange_k5, _inverse_lagrange_py
+
+    rng = random.Random(7)
+    for _ in range(200):
+        ys = sorted(rng.uniform(0.0, 30.0) for _ in range(5))
+        xs = [rng.uniform(0.0, 1.0) for _ in range(5)]
+        yt = rng.uniform(0.0, 30.0)
+        assert _inverse_lagrange_k5(*xs, *ys, yt, 1e-10) == pytest.approx(
+            _inverse_lagrange_py(xs, ys, yt, 1e-10), rel=1e-9, abs=1e-9
+        )
+
+    with pytest.raises(ValueError):
+        _inverse_lagrange_k5(0.0, 1.0, 2.0, 3.0, 4.0, 1.0, 2.0, 2.0, 3.0, 4.0, 2.5, 1e-10)
+
+
+def test_inverse_lagrange_memoizes_identical_windows():
+    from phoenix_engine.core.math.interpolation import inverse_lagrange_cached
+
+    inverse_lagrange_cached.cache_clear()
+    xs = (0.0, 0.25, 0.5, 0.75, 1.0)
+    ys = (10.0, 13.1, 16.3, 19.2, 22.4)
+    first = inverse_lagrange(xs, ys, 17.5)
+    assert inverse_lagrange(list(xs), list(ys), 17.5) == first
+    assert inverse_lagrange_cached.cache_info().hits == 1
+
+
+def test_five_node_window_duplicate_raises():
+    with pytest.raises(ValueError):
+        inverse_lagrange([0.0, 0.25, 0.5, 0.75, 1.0], [1.0, 2.0, 2.0, 3.0, 4.0], 2.5)
+
+
+def test_inverse_lagrange_core_mixed_input_types():
+    import numpy as np
+
+    from phoenix_engine.core.math.interpolation import inverse_lagrange_core
+
+    xs = [0, 1, 2, 3]
+    ys = [10, 13, 16, 19]
+    expected = inverse_lagrange_core([0.0, 1.0, 2.0, 3.0], (10.0, 13.0, 16.0, 19.0), 14.5)
+    assert expected == pytest.approx(1.5, abs=1e-12)
+    assert inverse_lagrange_core(xs, ys, 14.5) == pytest.approx(expected, abs=1e-12)
+    assert inverse_lagrange_core(np.array(xs), ys, 14.5) == pytest.approx(expected, abs=1e-12)
+
+
+def test_inverse_lagrange_many_matches_single_target_calls():
+    from phoenix_engine.core.math.interpolation import inverse_lagrange_core, inverse_lagrange_many
+
+    xs = [0.0, 0.25, 0.5, 0.75, 1.0] * 2
+    ys = [100.0 + 13.0 * x + 0.3 * x * x for x in xs[:5]]
+    ys += [y + 360.0 for y in ys]
+    targets = (106.0, 110.5, 462.0, 100.0)
+
+    out = inverse_lagrange_many(xs, ys, targets)
+    expected = [inverse_lagrange_core(xs, ys, t) for t in targets]
+    assert out == pytest.approx(expected, abs=1e-12)
+    assert out[3] == 0.0  # exact hit
+
+
+def test_inverse_lagrange_many_builds_one_weight_set_per_window(monkeypatch):
+    from phoenix_engine.core.math import interpolation
+
+    builds = []
+    real = interpolation._barycentric_weights_k5
+
+    def counting(*args):
+        builds.append(args)
+        return real(*args)
+
+    monkeypatch.setattr(interpolation, "HAS_NUMBA", False)
+    monkeypatch.setattr(interpolation, "_barycentric_weights_k5", counting)
+
+    xs = [0.0, 0.25, 0.5, 0.75, 1.0]
+    ys = [100.0 + 13.0 * x + 0.3 * x * x for x in xs]
+    out = interpolation.inverse_lagrange_many(xs, ys, (104.0, 109.5))
+    assert len(builds) == 1
+    assert out == pytest.approx([interpolation.inverse_lagrange_core(xs, ys, t) for t in (104.0, 109.5)], abs=1e-12)
+
+
+def test_weighted_evaluation_reuses_precomputed_weights():
+    from phoenix_engine.core.math.interpolation import (
+        _barycentric_weights_k5,
+        _inverse_lagrange_weighted_k5,
+        barycentric_weights,
+        inverse_lagrange_weighted,
+    )
+
+    ys = [0.0, 0.5, 0.8, 1.2, 1.5]
+    xs = [y * y + y for y in ys]
+    w = barycentric_weights(ys)
+    assert _barycentric_weights_k5(*ys, 1e-10) == pytest.approx(w, rel=1e-12)
+    assert inverse_lagrange_weighted(xs, ys, w, 1.0) == pytest.approx(2.0, abs=1e-12)
+    assert _inverse_lagrange_weighted_k5(*xs, *ys, *w, 0.3, 1e-10) == pytest.approx(0.39, abs=1e-12)
+    with pytest.raises(ValueError):
+        barycentric_weights([0.0, 1.0, 1.0])
+    with pytest.raises(ValueError):
+        _barycentric_weights_k5(0.0, 1.0, 1.0, 2.0, 3.0, 1e-10)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+
+from phoenix_engine.core.lru import GenerationalDict, PyLRU, make_lru
+
+
+@pytest.mark.parametrize("factory", [PyLRU, make_lru])
+def test_lru_evicts_least_recently_used(factory):
+    cache = factory(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # refresh "a"
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.get("b", "miss") == "miss"
+    assert len(cache) == 2
+
+
+def test_pylru_rejects_empty_bound():
+    with pytest.raises(ValueError):
+        PyLRU(0)
+
+
+def test_generational_dict_drops_entries_untouched_for_two_generations():
+    cache = GenerationalDict(sweep_every=2, keep_generations=2)
+    cache["old"] = 0
+    cache["hot"] = 1  # 2nd insert -> generation 1
+    cache["a"] = 2
+    assert cache.get("hot") == 1  # refreshed to generation 1
+    cache["b"] = 3  # generation 2; nothing older than 0 yet
+    assert "old" in cache
+    cache["c"] = 4
+    assert cache["hot"] == 1  # refreshed to generation 2
+    cache["d"] = 5  # generation 3: generation-0 entries go
+
+    assert "old" not in cache
+    assert "hot" in cache and "a" in cache
+    assert cache.get("old", "miss") == "miss"
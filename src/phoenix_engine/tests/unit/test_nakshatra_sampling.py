@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from phoenix_engine.vedic.panchanga.events import nakshatra
+
+
+def _moon(jd, body):
+    return (100.0 + 13.2 * (jd - 2460310.0)) % 360.0
+
+
+def test_batch_longitude_fn_matches_scalar_sampling():
+    kwargs = dict(
+        sunrise_fn=lambda jd, place: (0, 0, jd + 0.25),
+        sidereal_longitude_fn=_moon,
+        jd_to_gregorian_fn=lambda jd: (2024, 1, 1, 0.0),
+        gregorian_to_jd_fn=lambda y, m, d: 2460310.5,
+        moon_id=1,
+    )
+    place = SimpleNamespace(timezone=5.5)
+    calls = []
+
+    def moon_batch(jds, body):
+        calls.append(len(jds))
+        return np.mod(100.0 + 13.2 * (np.asarray(jds) - 2460310.0), 360.0)
+
+    scalar = nakshatra(2460310.5, place, **kwargs)
+    batched = nakshatra(2460310.5, place, sidereal_longitude_batch_fn=moon_batch, **kwargs)
+
+    assert batched[:2] == scalar[:2]
+    assert batched[2:] == pytest.approx(scalar[2:], abs=1e-9)
+    assert calls == [5, 5]  # one call per sunrise window (today and yesterday)
+
+
+@pytest.mark.parametrize(
+    "lon, expected",
+    [
+        (0.0, (1, 1)),
+        (30.0, (3, 2)),  # 9 padas exactly
+        (40.0, (4, 1)),  # 3 stars exactly
+        (359.999, (27, 4)),
+        (-1e-20, (1, 1)),  # wraps to 360.0 in float
+        (400.0, (4, 1)),
+    ],
+)
+def test_nakshatra_pada_boundaries(lon, expected):
+    from phoenix_engine.vedic.panchanga.temporal import ONE_STAR, nakshatra_pada_from_longitude
+
+    nak, pada, rem = nakshatra_pada_from_longitude(lon)
+    assert (nak, pada) == expected
+    assert 0.0 <= rem < ONE_STAR
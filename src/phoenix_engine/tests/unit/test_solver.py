@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 import math
+import numpy as np
 import pytest
 
-from phoenix_engine.core.math.solver import solve_root, NoBracketError
+from phoenix_engine.core.math.solver import (
+    NoBracketError,
+    bisection,
+    brent,
+    bracket_root,
+    bracket_root_batch,
+    newton_speed_assisted,
+    solve_root,
+)
 
 
 def test_solve_root_linear_newton_fast():
@@ -33,8 +42,8 @@ def test_solve_root_stationary_fallback_bisection():
 
     res = solve_root(f, -1.0, 1.0, accuracy_seconds=0.001, scan_step_days=0.2, min_speed=1e-6)
     assert abs(res.root_jd - 0.0) < (0.001 / 86400.0)
-    # most likely bisection
-    assert res.method in ("bisection", "newton", "bracket_hit")
+    # most likely the Brent fallback
+    assert res.method in ("brent", "bisection", "newton", "bracket_hit")
 
 
 def test_no_bracket_raises():
@@ -43,4 +52,69 @@ def test_no_bracket_raises():
         return (jd * jd + 1.0, 2.0 * jd)
 
     with pytest.raises(NoBracketError):
-        solve_root(f, 0.0, 2.0, scan_step_days=0.5)
\ No newline at end of file
+        solve_root(f, 0.0, 2.0, scan_step_days=0.5)
+
+def test_batch_bracket_matches_scalar_scan():
+    def f(jd: float):
+        return (jd * jd - 4.0, 2.0 * jd)
+
+    def f_batch(jds):
+        return jds * jds - 4.0, 2.0 * jds
+
+    scalar = bracket_root(f, 0.0, 5.0, step_days=0.3)
+    batched = bracket_root(f, 0.0, 5.0, step_days=0.3, f_batch=f_batch)
+    assert batched == pytest.approx(scalar)
+
+    res = solve_root(f, 0.0, 5.0, accuracy_seconds=0.001, scan_step_days=0.3, f_batch=f_batch)
+    assert abs(res.root_jd - 2.0) < (0.001 / 86400.0)
+
+    # batch-only callers: refinement goes through the scalar shim
+    res = solve_root(None, 0.0, 5.0, accuracy_seconds=0.001, scan_step_days=0.3, f_batch=f_batch)
+    assert abs(res.root_jd - 2.0) < (0.001 / 86400.0)
+
+
+def test_batch_bracket_no_sign_change_raises():
+    with pytest.raises(NoBracketError):
+        bracket_root_batch(lambda jds: (jds * 0.0 + 1.0, jds * 0.0), 0.0, 2.0, step_days=0.5)
+
+
+def test_safeguarded_newton_does_not_stall_on_overshoot():
+    # atan has a tiny slope far from the root: plain Newton from x0=10 overshoots
+    # past the bracket edge and bounces between the clamped endpoints.
+    def f(jd: float):
+        return (math.atan(jd), 1.0 / (1.0 + jd * jd))
+
+    res = newton_speed_assisted(f, 10.0, bracket=(-20.0, 30.0), tol_days=1e-9, max_iter=60)
+    assert abs(res.root_jd) < 1e-9
+    assert res.method == "newton"
+
+
+def test_brent_beats_bisection_on_smooth_root():
+    calls = {"n": 0}
+
+    def f(jd: float):
+        calls["n"] += 1
+        return (math.cos(jd) - jd, -math.sin(jd) - 1.0)
+
+    res = brent(f, 0.0, 1.0, tol_days=1e-12)
+    assert res.root_jd == pytest.approx(0.7390851332151607, abs=1e-11)
+    brent_calls, calls["n"] = calls["n"], 0
+
+    bisection(f, 0.0, 1.0, tol_days=1e-12)
+    assert brent_calls < calls["n"]
+
+
+def test_brent_requires_sign_change():
+    with pytest.raises(NoBracketError):
+        brent(lambda jd: (jd * jd + 1.0, 2.0 * jd), 0.0, 1.0, tol_days=1e-9)
+
+
+def test_sign_change_detected_for_tiny_values():
+    # va * vb underflows to -0.0 here; the scan must still see the crossing.
+    def f(jd: float):
+        return ((jd - 1.0) * 1e-200, 1e-200)
+
+    a, b = bracket_root(f, 0.0, 2.0, step_days=0.3)
+    assert a < 1.0 < b
+    res = bisection(f, a, b, tol_days=1e-9)
+    assert res.root_jd == pytest.approx(1.0, abs=1e-8)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from phoenix_engine.infrastructure.time.scale import (
+    DeltaTMode,
+    delta_t_days,
+    delta_t_quadratic,
+    tt_to_ut,
+    ut_to_tt,
+)
+
+
+def test_quadratic_delta_t_vertex_at_1820():
+    jd_1820 = 2451545.0 - 180.0 * 365.25
+    assert delta_t_quadratic(jd_1820) * 86400.0 == pytest.approx(-20.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("mode", [DeltaTMode.SWISS, DeltaTMode.QUADRATIC])
+def test_tt_to_ut_inverts_ut_to_tt(mode):
+    for jd_ut in (2378496.5, 2451545.0, 2460310.5):
+        assert tt_to_ut(ut_to_tt(jd_ut, mode), mode) == pytest.approx(jd_ut, abs=1e-10)
+
+
+def test_swiss_delta_t_is_memoized_on_rounded_jd():
+    delta_t_days(2460310.50001)
+    assert delta_t_days(2460310.50004) == delta_t_days(2460310.50001)
+    assert 60.0 < delta_t_days(2460310.5) * 86400.0 < 80.0
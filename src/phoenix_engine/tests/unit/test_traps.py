@@ -1,6 +1,7 @@
 from __future__ import annotations
 import pytest
-from phoenix_engine.core.config.calibration import CalibrationConfig
+from pydantic import ValidationError
+from phoenix_engine.core.config.calibration import CalibrationConfig, RiseSetPolicy, TopoConfig
 # FIXED IMPORTS: Moved from temporal to core.math.angles
 from phoenix_engine.core.math.angles import unwrap_relative, normalize_angle
 from phoenix_engine.domain.enums import PlanetId
@@ -10,15 +11,24 @@ from phoenix_engine.domain.enums import PlanetId
 # ---------------------------------------------------------
 def test_trap_mutable_defaults_in_config():
     """
-    Ensures that modifying a nested config object does NOT affect 
-    new instances (checking for shared reference bugs).
+    Ensures that deriving a config with different nested policy does NOT
+    affect other instances (checking for shared reference bugs), and that
+    nested policy cannot be mutated in place.
     """
     cfg1 = CalibrationConfig()
-    cfg1.sunrise.use_refraction = False
-    cfg1.topo.enabled = True
-    
+    with pytest.raises(ValidationError):
+        cfg1.sunrise.use_refraction = False
+    with pytest.raises(ValidationError):
+        cfg1.topo.enabled = True
+
+    cfg_custom = CalibrationConfig(
+        sunrise=RiseSetPolicy(use_refraction=False),
+        topo=TopoConfig(enabled=True),
+    )
     cfg2 = CalibrationConfig()
-    
+
+    assert cfg_custom.sunrise.use_refraction is False
+    assert cfg2.sunrise is not cfg1.sunrise, "CRITICAL: SunriseConfig is shared between instances!"
     assert cfg2.sunrise.use_refraction is True, "CRITICAL: SunriseConfig is shared between instances!"
     assert cfg2.topo.enabled is False, "CRITICAL: TopoConfig is shared between instances!"
 
@@ -21,6 +21,7 @@ def nakshatra(
     jd_to_gregorian_fn=None,
     gregorian_to_jd_fn=None,
     moon_id=None,
+    sidereal_longitude_batch_fn=None,
 ) -> List[float]:
     today = _get_nakshatra_end_hours(
         jd,
@@ -31,6 +32,7 @@ def nakshatra(
         jd_to_gregorian_fn=jd_to_gregorian_fn,
         gregorian_to_jd_fn=gregorian_to_jd_fn,
         moon_id=moon_id,
+        sidereal_longitude_batch_fn=sidereal_longitude_batch_fn,
     )
     prev = _get_nakshatra_end_hours(
         jd - 1,
@@ -41,6 +43,7 @@ def nakshatra(
         jd_to_gregorian_fn=jd_to_gregorian_fn,
         gregorian_to_jd_fn=gregorian_to_jd_fn,
         moon_id=moon_id,
+        sidereal_longitude_batch_fn=sidereal_longitude_batch_fn,
     )
 
     start = prev[2]
@@ -2,108 +2,244 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Final, List, Optional, Tuple
 
+import numpy as np
+
+from phoenix_engine.core.jit import SAFE_FASTMATH, njit
 from phoenix_engine.core.math.angles import extend_angle_range, normalize_angle, unwrap_angles
-from phoenix_engine.core.math.interpolation import inverse_lagrange
-from phoenix_engine.core.math.solver import SolveResult, solve_root
+from phoenix_engine.core.math.interpolation import inverse_lagrange_many
+from phoenix_engine.core.math.solver import (
+    NoBracketError,
+    SolveResult,
+    ValueSpeedFn,
+    solve_root,
+)
+from phoenix_engine.domain.bodies import Body
 from phoenix_engine.infrastructure.astronomy.swiss.provider import EphemerisProvider
 from phoenix_engine.vedic.panchanga.temporal import (
+    INDEX_FRACTION_BITS,
     ONE_STAR,
-    nakshatra_continuous,
+    nakshatra_continuous_prenorm,
+    nakshatra_continuous_vec,
     nakshatra_pada_from_longitude,
-    tithi_continuous,
-    yoga_continuous,
+    tithi_continuous_prenorm,
+    tithi_continuous_vec,
+    to_fixed,
+    yoga_continuous_prenorm,
+    yoga_continuous_vec,
 )
 
-try:
-    from phoenix_engine.domain.enums import SUN as _SUN, MOON as _MOON  # type: ignore
-    SUN = int(_SUN)
-    MOON = int(_MOON)
-except Exception:
-    try:
-        from phoenix_engine.domain.bodies import Body
-        SUN = int(Body.SUN)
-        MOON = int(Body.MOON)
-    except Exception:
-        SUN = 0
-        MOON = 1
+# plain ints (not IntEnum) for the hot provider calls
+SUN: Final[int] = int(Body.SUN)
+MOON: Final[int] = int(Body.MOON)
 
 
-def _unwrap_cycle(val: float, target: float, period: float) -> float:
-    if target >= period and val < (period / 2.0):
-        return val + period
-    return val
+# Moon sampling offsets (days after sunrise) for the sunrise-anchored nakshatra fit.
+_OFFSETS = (0.0, 0.25, 0.5, 0.75, 1.0)
+_OFFSETS_NP = np.array(_OFFSETS, dtype=np.float64)
 
 
-@dataclass(frozen=True)
-class SearchParams:
-    accuracy_seconds: float = 0.1
-    scan_step_days: float = 1.0 / 12.0
-    max_days_ahead: float = 1.5
+# Residual kernels for the scalar solver callbacks: ephemeris lookups stay in
+# the closures, the index/unwrap arithmetic runs compiled. The residual is
+# wrapped to [-period/2, period/2), which covers the last division's wrap.
+# They return (residual, derivative): the index rate from the Swiss speeds is
+# the exact d(residual)/d(jd) that solve_root's Newton steps use.
+_SIG_SUN_MOON_RESIDUAL = "UniTuple(float64, 2)(float64, float64, float64, float64, float64)"
+_SIG_MOON_RESIDUAL = "UniTuple(float64, 2)(float64, float64, float64)"
 
 
-class PanchangaFinder:
-    def __init__(self, provider: EphemerisProvider):
-        self.provider = provider
+@njit(_SIG_SUN_MOON_RESIDUAL, cache=True, fastmath=SAFE_FASTMATH)
+def _tithi_residual(m: float, ms: float, s: float, ss: float, target: float) -> Tuple[float, float]:
+    val, speed = tithi_continuous_prenorm(m, ms, s, ss)
+    d = val - target
+    return d - 30.0 * math.floor(d * (1.0 / 30.0) + 0.5), speed
 
-    def next_tithi_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
-        p = params or SearchParams(max_days_ahead=1.5)
 
-        s0, ss0 = self.provider.planet_lon_speed(start_jd, SUN)
-        m0, ms0 = self.provider.planet_lon_speed(start_jd, MOON)
-        curr, _ = tithi_continuous(m0, ms0, s0, ss0)
+@njit(_SIG_MOON_RESIDUAL, cache=True, fastmath=SAFE_FASTMATH)
+def _nakshatra_residual(m: float, ms: float, target: float) -> Tuple[float, float]:
+    val, speed = nakshatra_continuous_prenorm(m, ms)
+    d = val - target
+    return d - 27.0 * math.floor(d * (1.0 / 27.0) + 0.5), speed
 
-        target = math.floor(curr) + 1.0
-        period = 30.0
 
-        def f(jd: float) -> Tuple[float, float]:
-            s, ss = self.provider.planet_lon_speed(jd, SUN)
-            m, ms = self.provider.planet_lon_speed(jd, MOON)
-            val, speed = tithi_continuous(m, ms, s, ss)
-            val = _unwrap_cycle(val, target, period)
-            return (val - target, speed)
+@njit(_SIG_SUN_MOON_RESIDUAL, cache=True, fastmath=SAFE_FASTMATH)
+def _yoga_residual(m: float, ms: float, s: float, ss: float, target: float) -> Tuple[float, float]:
+    val, speed = yoga_continuous_prenorm(m, ms, s, ss)
+    d = val - target
+    return d - 27.0 * math.floor(d * (1.0 / 27.0) + 0.5), speed
 
-        return solve_root(f, float(start_jd), float(start_jd + p.max_days_ahead),
-                          accuracy_seconds=float(p.accuracy_seconds), scan_step_days=float(p.scan_step_days))
 
-    def next_nakshatra_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
-        p = params or SearchParams(max_days_ahead=1.3)
+@dataclass(frozen=True, slots=True)
+class _EventSpec:
+    period: float
+    max_days_ahead: float  # default search window
+    uses_sun: bool  # (moon, sun) arguments vs moon only
+    continuous: Callable
+    residual: Callable
+    continuous_vec: Callable
 
-        m0, ms0 = self.provider.planet_lon_speed(start_jd, MOON)
-        curr, _ = nakshatra_continuous(m0, ms0)
 
-        target = math.floor(curr) + 1.0
-        period = 27.0
+_EVENT_TABLE = {
+    "tithi": _EventSpec(30.0, 1.5, True, tithi_continuous_prenorm, _tithi_residual, tithi_continuous_vec),
+    "nakshatra": _EventSpec(27.0, 1.3, False, nakshatra_continuous_prenorm, _nakshatra_residual, nakshatra_continuous_vec),
+    "yoga": _EventSpec(27.0, 1.3, True, yoga_continuous_prenorm, _yoga_residual, yoga_continuous_vec),
+}
 
-        def f(jd: float) -> Tuple[float, float]:
-            m, ms = self.provider.planet_lon_speed(jd, MOON)
-            val, speed = nakshatra_continuous(m, ms)
-            val = _unwrap_cycle(val, target, period)
-            return (val - target, speed)
 
-        return solve_root(f, float(start_jd), float(start_jd + p.max_days_ahead),
-                          accuracy_seconds=float(p.accuracy_seconds), scan_step_days=float(p.scan_step_days))
+@dataclass(frozen=True, slots=True)
+class SearchParams:
+    accuracy_seconds: float = 0.1
+    scan_step_days: float = 1.0 / 12.0
+    max_days_ahead: float = 1.5
+    # Bracket [0.9, 1.2] x the linear-motion ETA from the start speed and
+    # refine there (two endpoint probes instead of a scan); the full
+    # `scan_step_days` scan runs only if that bracket misses the crossing,
+    # or always when disabled.
+    speed_bracket: bool = True
+
 
-    def next_yoga_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
-        p = params or SearchParams(max_days_ahead=1.3)
+class PanchangaFinder:
+    def __init__(self, provider: EphemerisProvider):
+        self.provider = provider
 
-        s0, ss0 = self.provider.planet_lon_speed(start_jd, SUN)
-        m0, ms0 = self.provider.planet_lon_speed(start_jd, MOON)
-        curr, _ = yoga_continuous(m0, ms0, s0, ss0)
+    def _solve(
+        self,
+        f: ValueSpeedFn,
+        start_jd: float,
+        p: SearchParams,
+        *,
+        residual0: Optional[float] = None,
+        speed0: Optional[float] = None,
+    ) -> SolveResult:
+        # SearchParams fields are already float/int and the solvers coerce
+        # their own inputs; pass everything through as is
+        end_jd = start_jd + p.max_days_ahead
+        if p.speed_bracket and residual0 is not None and speed0 is not None and speed0 > 0.0:
+            eta = -residual0 / speed0
+            a = start_jd + 0.9 * eta
+            b = min(start_jd + 1.2 * eta, end_jd)
+            if a < b:
+                try:
+                    # one-step scan: just the two endpoint probes
+                    return solve_root(f, a, b, accuracy_seconds=p.accuracy_seconds, scan_step_days=b - a)
+                except NoBracketError:
+                    pass
+        return solve_root(f, start_jd, end_jd, accuracy_seconds=p.accuracy_seconds, scan_step_days=p.scan_step_days)
+
+    def _next_event_end(self, kind: str, start_jd: float, params: Optional[SearchParams]) -> SolveResult:
+        spec = _EVENT_TABLE[kind]
+        p = params or SearchParams(max_days_ahead=spec.max_days_ahead)
+        residual = spec.residual
+        provider = self.provider
+
+        # the body set is fixed per kind: pick the closures once, not per call
+        if spec.uses_sun:
+            sun_moon = provider.sun_moon_lon_speed
+            s0, ss0, m0, ms0 = sun_moon(start_jd)
+            curr, speed0 = spec.continuous(m0, ms0, s0, ss0)
+            # prenorm indices are >= 0, so int() truncation is the floor
+            target = float(int(curr) + 1)
+
+            def f(jd: float) -> Tuple[float, float]:
+                s, ss, m, ms = sun_moon(jd)
+                return residual(m, ms, s, ss, target)
+
+        else:
+            moon_lon_speed = provider.planet_lon_speed
+            m0, ms0 = moon_lon_speed(start_jd, MOON)
+            curr, speed0 = spec.continuous(m0, ms0)
+            target = float(int(curr) + 1)
+
+            def f(jd: float) -> Tuple[float, float]:
+                m, ms = moon_lon_speed(jd, MOON)
+                return residual(m, ms, target)
+        return self._solve(f, start_jd, p, residual0=curr - target, speed0=speed0)
 
-        target = math.floor(curr) + 1.0
-        period = 27.0
+    def next_tithi_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
+        return self._next_event_end("tithi", start_jd, params)
 
-        def f(jd: float) -> Tuple[float, float]:
-            s, ss = self.provider.planet_lon_speed(jd, SUN)
-            m, ms = self.provider.planet_lon_speed(jd, MOON)
-            val, speed = yoga_continuous(m, ms, s, ss)
-            val = _unwrap_cycle(val, target, period)
-            return (val - target, speed)
+    def next_nakshatra_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
+        return self._next_event_end("nakshatra", start_jd, params)
 
-        return solve_root(f, float(start_jd), float(start_jd + p.max_days_ahead),
-                          accuracy_seconds=float(p.accuracy_seconds), scan_step_days=float(p.scan_step_days))
+    def next_yoga_end(self, start_jd: float, *, params: Optional[SearchParams] = None) -> SolveResult:
+        return self._next_event_end("yoga", start_jd, params)
+
+    def _find_all_event_ends(
+        self,
+        kind: str,
+        start_jd: float,
+        end_jd: float,
+        *,
+        step_days: float,
+        accuracy_seconds: float,
+        max_iter: int,
+    ) -> np.ndarray:
+        if end_jd <= start_jd:
+            raise ValueError("end_jd must be > start_jd")
+        if step_days <= 0:
+            raise ValueError("step_days must be > 0")
+        spec = _EVENT_TABLE[kind]
+        period = spec.period
+        batch = self.provider.batch_planet_lon_speed
+
+        def sample(jds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            m, ms = batch(jds, MOON)
+            if spec.uses_sun:
+                s, ss = batch(jds, SUN)
+                return spec.continuous_vec(m, ms, s, ss)
+            return spec.continuous_vec(m, ms)
+
+        # (a) one SoA fill of the grid, (b) crossings as integer-part changes
+        # of the fixed-point index (shift + compare, no float floor)
+        jds = np.append(np.arange(start_jd, end_jd, step_days), end_jd)
+        vals, speeds = sample(jds)
+        whole = to_fixed(vals) >> INDEX_FRACTION_BITS
+        i = np.flatnonzero(np.diff(whole))
+        if i.size == 0:
+            return np.empty(0, dtype=np.float64)
+
+        # (c) all crossings refined together: batched Newton from the linear ETA,
+        # clamped to each grid cell; the wrapped residual handles target == period
+        lo = jds[i]
+        hi = jds[i + 1]
+        targets = whole[i] + 1.0
+        x = np.clip(lo + (targets - vals[i]) / speeds[i], lo, hi)
+        tol_days = accuracy_seconds / 86400.0
+        dx = np.full(x.shape, np.inf)
+        for _ in range(max_iter):
+            v, spd = sample(x)
+            d = v - targets
+            d -= period * np.floor(d / period + 0.5)
+            dx = d / spd
+            x = np.clip(x - dx, lo, hi)
+            if np.max(np.abs(dx)) <= tol_days:
+                break
+
+        # (d) crossings the batched steps left unconverged go through the
+        # scalar solver from their cell start; the window runs one step past
+        # the cell so a root sitting on `hi` still gets a sign change
+        for j in np.flatnonzero(~(np.abs(dx) <= tol_days)):
+            p = SearchParams(accuracy_seconds=accuracy_seconds, max_days_ahead=float(hi[j] - lo[j]) + step_days)
+            x[j] = self._next_event_end(kind, float(lo[j]), p).root_jd
+        return x
+
+    def find_all_tithi_ends(
+        self,
+        start_jd: float,
+        end_jd: float,
+        *,
+        step_days: float = 0.25,
+        accuracy_seconds: float = 0.1,
+        max_iter: int = 8,
+    ) -> np.ndarray:
+        """Every tithi end in ``[start_jd, end_jd]`` as a sorted float64 array.
+
+        ``step_days`` must stay below the shortest tithi (~0.8 day) so each
+        grid cell holds at most one crossing.
+        """
+        return self._find_all_event_ends("tithi", start_jd, end_jd, step_days=step_days,
+                                         accuracy_seconds=accuracy_seconds, max_iter=max_iter)
 
 
 def _get_nakshatra_end_hours(
@@ -115,6 +251,7 @@ def _get_nakshatra_end_hours(
     jd_to_gregorian_fn: Optional[Callable] = None,
     gregorian_to_jd_fn: Optional[Callable] = None,
     moon_id: Optional[int] = None,
+    sidereal_longitude_batch_fn: Optional[Callable] = None,
 ) -> List[float]:
     """Compute nakshatra end times anchored to sunrise.
 
@@ -124,6 +261,10 @@ def _get_nakshatra_end_hours(
     - sample Moon lon at rise + [0, .25, .5, .75, 1.0]
     - unwrap/extend angles
     - inverse_lagrange for boundary (nak * ONE_STAR)
+
+    ``sidereal_longitude_batch_fn(jds, body)`` (e.g. a wrapper over
+    ``EphemerisProvider.batch_planet_lon_speed``) samples all offsets in one
+    call when supplied.
     """
     if sunrise_fn is None:
         raise NotImplementedError("TODO: inject sunrise_fn (see nakshatra.md)")
@@ -141,23 +282,28 @@ def _get_nakshatra_end_hours(
     year, month, day, _ = jd_to_gregorian_fn(jd)
     jd_ut0 = gregorian_to_jd_fn(year, month, day)
 
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
-    longs = [sidereal_longitude_fn(rise + off, moon_id) for off in offsets]
+    if sidereal_longitude_batch_fn is not None:
+        longs = np.asarray(sidereal_longitude_batch_fn(rise + _OFFSETS_NP, moon_id), dtype=np.float64)
+    else:
+        longs = np.fromiter(
+            (sidereal_longitude_fn(rise + off, moon_id) for off in _OFFSETS), dtype=np.float64, count=len(_OFFSETS)
+        )
 
     unwrapped = unwrap_angles(longs)
     extended = extend_angle_range(unwrapped, span=360.0)
-    x = offsets * (len(extended) // len(unwrapped))
+    x = np.tile(_OFFSETS_NP, len(extended) // len(unwrapped))
 
     moon_long = sidereal_longitude_fn(jd_utc, moon_id) if lunar_longitude_fn is None else lunar_longitude_fn(jd_utc)
     nak_no, pada_no, _ = nakshatra_pada_from_longitude(moon_long)
 
-    y1 = normalize_angle(nak_no * ONE_STAR, start=min(extended))
-    approx1 = inverse_lagrange(x, extended, y1)
-    end_hours = (rise - jd_ut0 + approx1) * 24.0 + tz
-
     leap_nak = 1 if nak_no == 27 else (nak_no + 1)
-    y2 = normalize_angle(leap_nak * ONE_STAR, start=min(extended))
-    approx2 = inverse_lagrange(x, extended, y2)
+    lo = min(extended)
+    y1 = normalize_angle(nak_no * ONE_STAR, start=lo)
+    y2 = normalize_angle(leap_nak * ONE_STAR, start=lo)
+    # both boundaries usually fall in the same node window -> one weight set
+    approx1, approx2 = inverse_lagrange_many(x, extended, (y1, y2))
+
+    end_hours = (rise - jd_ut0 + approx1) * 24.0 + tz
     end2_hours = (rise - jd_ut0 + approx2) * 24.0 + tz
 
     return [nak_no, pada_no, end_hours, leap_nak, pada_no, end2_hours]
@@ -2,53 +2,142 @@ from __future__ import annotations
 
 """Temporal helpers for Panchanga calculations."""
 
+import math
 from typing import Tuple
 
-from phoenix_engine.core.math.angles import normalize_angle
+import numpy as np
+
+from phoenix_engine.core.jit import SAFE_FASTMATH, njit
 
 ONE_STAR = 360.0 / 27.0
 ONE_PADA = 360.0 / 108.0
 
 
+# The three solver callbacks below are compiled when Numba is available
+# (pure float math; normalize_angle is inlined as the floor form). Explicit
+# signatures compile eagerly at import and skip per-call type dispatch.
+_SIG_PAIR = "UniTuple(float64, 2)(float64, float64)"
+_SIG_QUAD = "UniTuple(float64, 2)(float64, float64, float64, float64)"
+
+
+@njit(_SIG_QUAD, cache=True, fastmath=SAFE_FASTMATH)
 def tithi_continuous(moon_lon: float, moon_spd: float, sun_lon: float, sun_spd: float) -> Tuple[float, float]:
     """Return (tithi_index, tithi_speed_per_day).
 
     1 tithi = 12 degrees of (Moon - Sun). Index in [0, 30).
     """
-    dist = normalize_angle(moon_lon - sun_lon, start=0.0, period=360.0)
+    d = moon_lon - sun_lon
+    dist = d - 360.0 * math.floor(d * (1.0 / 360.0))
     rel_speed = moon_spd - sun_spd
     return dist / 12.0, rel_speed / 12.0
 
 
+@njit(_SIG_PAIR, cache=True, fastmath=SAFE_FASTMATH)
 def nakshatra_continuous(moon_lon: float, moon_spd: float) -> Tuple[float, float]:
     """Return (nak_index, nak_speed_per_day) with 27 divisions."""
     scale = 27.0 / 360.0
-    lon = normalize_angle(moon_lon, start=0.0, period=360.0)
+    lon = moon_lon - 360.0 * math.floor(moon_lon * (1.0 / 360.0))
     return lon * scale, moon_spd * scale
 
 
+@njit(_SIG_QUAD, cache=True, fastmath=SAFE_FASTMATH)
 def yoga_continuous(moon_lon: float, moon_spd: float, sun_lon: float, sun_spd: float) -> Tuple[float, float]:
     """Return (yoga_index, yoga_speed_per_day) where yoga uses (Moon + Sun) over 27."""
     scale = 27.0 / 360.0
-    s = normalize_angle(moon_lon + sun_lon, start=0.0, period=360.0)
+    t = moon_lon + sun_lon
+    s = t - 360.0 * math.floor(t * (1.0 / 360.0))
     spd = moon_spd + sun_spd
     return s * scale, spd * scale
 
 
+# Variants for longitudes already in [0, 360) (Swiss output via the provider):
+# only the difference/sum can leave the range, by at most one turn, so a single
+# compare replaces the floor. The public API keeps the general versions.
+
+@njit(_SIG_QUAD, cache=True, fastmath=SAFE_FASTMATH)
+def tithi_continuous_prenorm(moon_lon: float, moon_spd: float, sun_lon: float, sun_spd: float) -> Tuple[float, float]:
+    dist = moon_lon - sun_lon
+    if dist < 0.0:
+        dist += 360.0
+    return dist / 12.0, (moon_spd - sun_spd) / 12.0
+
+
+@njit(_SIG_PAIR, cache=True, fastmath=SAFE_FASTMATH)
+def nakshatra_continuous_prenorm(moon_lon: float, moon_spd: float) -> Tuple[float, float]:
+    scale = 27.0 / 360.0
+    return moon_lon * scale, moon_spd * scale
+
+
+@njit(_SIG_QUAD, cache=True, fastmath=SAFE_FASTMATH)
+def yoga_continuous_prenorm(moon_lon: float, moon_spd: float, sun_lon: float, sun_spd: float) -> Tuple[float, float]:
+    scale = 27.0 / 360.0
+    s = moon_lon + sun_lon
+    if s >= 360.0:
+        s -= 360.0
+    return s * scale, (moon_spd + sun_spd) * scale
+
+
+# Array (SoA) twins of the above for grid searches: same formulas, one ufunc pass.
+
+def tithi_continuous_vec(
+    moon_lon: np.ndarray, moon_spd: np.ndarray, sun_lon: np.ndarray, sun_spd: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    dist = np.mod(moon_lon - sun_lon, 360.0)
+    return dist / 12.0, (moon_spd - sun_spd) / 12.0
+
+
+def nakshatra_continuous_vec(moon_lon: np.ndarray, moon_spd: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    scale = 27.0 / 360.0
+    return np.mod(moon_lon, 360.0) * scale, moon_spd * scale
+
+
+def yoga_continuous_vec(
+    moon_lon: np.ndarray, moon_spd: np.ndarray, sun_lon: np.ndarray, sun_spd: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    scale = 27.0 / 360.0
+    return np.mod(moon_lon + sun_lon, 360.0) * scale, (moon_spd + sun_spd) * scale
+
+
+# Q32 fixed point for the batch crossing search: the integer part of a
+# non-negative index is ``fx >> INDEX_FRACTION_BITS`` (exact floor; the
+# power-of-two scale introduces no rounding).
+INDEX_FRACTION_BITS = 32
+_INDEX_ONE = float(1 << INDEX_FRACTION_BITS)
+
+
+def to_fixed(index: np.ndarray) -> np.ndarray:
+    """Non-negative continuous indices as int64 in units of 2**-32."""
+    return (np.asarray(index, dtype=np.float64) * _INDEX_ONE).astype(np.int64)
+
+
+_INV_360 = 1.0 / 360.0
+
+
 def nakshatra_pada_from_longitude(lon_deg: float) -> tuple[int, int, float]:
     """Return (nakshatra_no, pada_no, remainder) from sidereal longitude."""
-    lon = normalize_angle(lon_deg, start=0.0, period=360.0)
-    quotient = int(lon / ONE_STAR)
-    remainder = lon % ONE_STAR
-    pada = int(remainder / ONE_PADA)
-    return 1 + quotient, 1 + pada, remainder
+    # multiplies only: q is the continuous star index; the fractional part
+    # times 4 (exact, a power of two) gives the pada, so pada < 4 always
+    q = (lon_deg - 360.0 * math.floor(lon_deg * _INV_360)) * (27.0 / 360.0)
+    nak = int(q)
+    if nak == 27:  # lon rounded up to 360.0
+        nak, q = 0, 0.0
+    frac = q - nak
+    return 1 + nak, 1 + int(frac * 4.0), frac * ONE_STAR
 
 
 __all__ = [
+    "INDEX_FRACTION_BITS",
     "ONE_PADA",
     "ONE_STAR",
     "nakshatra_pada_from_longitude",
     "nakshatra_continuous",
+    "nakshatra_continuous_prenorm",
+    "nakshatra_continuous_vec",
     "tithi_continuous",
+    "tithi_continuous_prenorm",
+    "tithi_continuous_vec",
+    "to_fixed",
     "yoga_continuous",
+    "yoga_continuous_prenorm",
+    "yoga_continuous_vec",
 ]
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import swisseph as swe
 
-from phoenix_engine.core.config.calibration import CalibrationConfig, RiseSetStyle
+from phoenix_engine.core.config.calibration import CalibrationConfig, RiseSetPolicy, RiseSetStyle
 from phoenix_engine.infrastructure.astronomy.swiss.manager import SwissContextManager
 
 
 def test_rise_set_style_differs():
     cfg_py = CalibrationConfig()
-    cfg_disc = CalibrationConfig()
-    cfg_disc.sunrise.style = RiseSetStyle.DISC_POLICY
+    cfg_disc = CalibrationConfig(sunrise=RiseSetPolicy(style=RiseSetStyle.DISC_POLICY))
 
     start_jd = 2460310.5  # ~2024-01-01
     lon, lat = 77.2090, 28.6139